@@ -0,0 +1,84 @@
+import re
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+import numpy as np
+
+# Arabic diacritics (harakat) and tatweel
+_ARABIC_MARKS = re.compile(r"[\u064B-\u0652\u0670\u0640]")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.,;:؟،؛]+$")
+
+
+def normalize_question(question):
+    """Key for exact matches: case, diacritics, spacing and final punctuation do not count"""
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = _ARABIC_MARKS.sub("", text)
+    text = " ".join(text.split())
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+class _Entry:
+    def __init__(self, response, vector):
+        self.response = response
+        self.vector = vector
+        self.created = time.monotonic()
+
+
+class AnswerCache:
+    """Two-level answer cache: exact LRU on the normalized question, then semantic
+
+    A miss on the exact level embeds the question and returns the answer of
+    the most similar cached question if its cosine similarity reaches
+    threshold. Entries expire after ttl seconds; the least recently used
+    entry is evicted beyond max_size.
+    """
+
+    def __init__(self, embeddings, max_size=512, ttl=3600, threshold=0.95):
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.ttl = ttl
+        self.threshold = threshold
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _embed(self, question):
+        vector = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _expire(self):
+        deadline = time.monotonic() - self.ttl
+        for key in [key for key, entry in self.entries.items() if entry.created < deadline]:
+            del self.entries[key]
+
+    def get(self, question):
+        """The cached response for question, or None"""
+        key = normalize_question(question)
+        with self.lock:
+            self._expire()
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key].response
+            if not self.entries:
+                return None
+        vector = self._embed(question)
+        with self.lock:
+            if not self.entries:
+                return None
+            keys = list(self.entries)
+            scores = np.stack([self.entries[k].vector for k in keys]) @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            self.entries.move_to_end(keys[best])
+            return self.entries[keys[best]].response
+
+    def put(self, question, response):
+        key = normalize_question(question)
+        vector = self._embed(question)
+        with self.lock:
+            self.entries[key] = _Entry(response, vector)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
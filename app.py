@@ -1,13 +1,24 @@
 import os
+import json
 import streamlit as st
 from langchain_groq import ChatGroq
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_chroma import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.chains import ConversationalRetrievalChain
-from langchain.memory import ConversationBufferMemory
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
+from langchain_community.document_loaders import PyPDFLoader
 from pypdf.errors import PdfReadError, PdfStreamError
+from pdf_parsing import list_pdfs, iter_parsed_pdfs
+from embedding_engine import build_embeddings
+from chunking import build_text_splitter, token_counter
+from answer_cache import AnswerCache
+from instrumentation import Metrics, StageTimer, TimedEmbeddings, start_metrics_server
+from streaming import stream_chain
+from condense import SelectiveCondenseChain
+from summary_memory import RollingSummaryMemory
+from reranker import ScoreCache
+from retrieval import ARABIC_PROMPT_PREFIX
+import retrieval
+from flat_index import FlatVectorStore, flat_index_path
+from store_versions import live_directory
+import config
 
 # Load env vars
 api_grok = "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"
@@ -20,27 +31,23 @@ if not os.environ.get("GROQ_API_KEY"):
 # Initialize language model, embeddings and text splitter
 @st.cache_resource()
 def initialize_models():
-    llm = ChatGroq(model_name="llama-3.3-70b-versatile", temperature=0.7, max_tokens=2048)
-    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-mpnet-base-v2",
-                                       model_kwargs={'device': 'cpu'})
+    llm = ChatGroq(model_name="llama-3.3-70b-versatile", temperature=0.7, max_tokens=2048, streaming=True)
+    embeddings = build_embeddings()
+    # Loaded here rather than on the first turn that counts memory tokens
+    token_counter().tokenizer
     return llm, embeddings
 
 llm, embeddings = initialize_models()
-text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, length_function=len)
+text_splitter = build_text_splitter()
 
-def load_pdfs(pdf_path, is_directory=False):
+def load_pdfs(pdf_path, is_directory=False, workers=None):
     all_documents = []
     if is_directory:
-        loader = DirectoryLoader(
-            pdf_path,
-            glob="**/*.pdf",
-            loader_cls=PyPDFLoader
-        )
-        for document in loader.lazy_load():
-            try:
-              all_documents.append(document)
-            except (PdfReadError, PdfStreamError) as e:
-              print(f"Error loading file {document.metadata['source']}: {e}")
+        for pdf_file, pages, error in iter_parsed_pdfs(list_pdfs(pdf_path), workers):
+            if error:
+              print(f"Error loading file {pdf_file}: {error}")
+              continue
+            all_documents.extend(pages)
     else:
         loader = PyPDFLoader(pdf_path)
         try:
@@ -59,27 +66,109 @@ def create_vectorstore(documents, persist_directory, _embeddings):  # Changed em
     )
     return vectorstore
 
-@st.cache_resource()
+# Keyed by the store version: the previous one stays open for sessions still using it
+@st.cache_resource(max_entries=2)
 def load_vectorstore(persist_directory, _embeddings):  # Changed embeddings to _embeddings
+    if config.VECTOR_INDEX == "flat" and os.path.exists(flat_index_path(persist_directory)):
+        # Memory-mapped: pages are shared with the other app processes
+        return FlatVectorStore(flat_index_path(persist_directory), _embeddings,
+                               rescore_k=config.FLAT_INDEX_RESCORE_K)
     vectorstore = Chroma(persist_directory=persist_directory, embedding_function=_embeddings)  # Changed embeddings to _embeddings
     return vectorstore
 
-def setup_chain(vectorstore, llm, memory):
-    chain = ConversationalRetrievalChain.from_llm(
+@st.cache_resource()
+def load_reranker():
+    from sentence_transformers import CrossEncoder
+    return CrossEncoder(config.RERANK_MODEL, device='cpu'), ScoreCache()
+
+def build_retriever(vectorstore, persist_directory):
+    return retrieval.build_retriever(vectorstore, persist_directory, load_reranker() if config.RERANK else None)
+
+def setup_chain(vectorstore, llm, memory, retriever=None):
+    # Condenses with the chat history only when the question refers to it
+    chain = SelectiveCondenseChain.from_llm(
         llm=llm,
-        retriever=vectorstore.as_retriever(search_kwargs={"k": 3}),
+        retriever=retriever or vectorstore.as_retriever(search_kwargs={"k": 3}),
         memory=memory,
         return_source_documents=True,
+        embeddings=vectorstore.embeddings,
+        question_prefix=ARABIC_PROMPT_PREFIX,
+        similarity_threshold=config.CONDENSE_SIMILARITY_THRESHOLD,
     )
     return chain
 
-def query_documents(chain, question):
-    arabic_prompt = f"يرجى الإجابة على السؤال التالي باللغة العربية: {question}"
-    response = chain.invoke({"question": arabic_prompt})
-    return {
+# Shared by every session of this process; a new store version starts an empty cache
+@st.cache_resource(max_entries=2)
+def get_answer_cache(store_directory, _embeddings):
+    return AnswerCache(_embeddings, max_size=config.ANSWER_CACHE_SIZE,
+                       ttl=config.ANSWER_CACHE_TTL, threshold=config.ANSWER_CACHE_THRESHOLD)
+
+@st.cache_resource()
+def get_metrics():
+    metrics = Metrics()
+    if config.METRICS_PORT:
+        start_metrics_server(metrics, config.METRICS_PORT)
+    return metrics
+
+def arabic_prompt_for(question):
+    return f"{ARABIC_PROMPT_PREFIX}{question}"
+
+def answer_cache_for(chain, cache):
+    # Follow-ups depend on the conversation, only opening questions are cached
+    return None if chain.memory.chat_memory.messages else cache
+
+def cached_answer(chain, question, cache):
+    if cache is None:
+        return None
+    cached = cache.get(question)
+    if cached is not None:
+        chain.memory.save_context({"question": arabic_prompt_for(question)}, {"answer": cached["answer"]})
+    return cached
+
+def remember_answer(chain, question, cache, response):
+    result = {
         "answer": response["answer"],
         "source_documents": response["source_documents"]
     }
+    if cache is not None:
+        cache.put(question, result)
+    return result
+
+def query_documents(chain, question, cache=None, metrics=None):
+    cache = answer_cache_for(chain, cache)
+    cached = cached_answer(chain, question, cache)
+    if cached is not None:
+        return cached
+    callbacks = [StageTimer(metrics)] if metrics is not None else []
+    response = chain.invoke({"question": arabic_prompt_for(question)}, config={"callbacks": callbacks})
+    return remember_answer(chain, question, cache, response)
+
+def stream_documents(chain, question, cache=None, metrics=None):
+    """Like query_documents, but yields ("sources", docs) and ("token", text) as they arrive"""
+    cache = answer_cache_for(chain, cache)
+    cached = cached_answer(chain, question, cache)
+    if cached is not None:
+        yield "sources", cached["source_documents"]
+        yield "token", cached["answer"]
+        return
+    callbacks = [StageTimer(metrics)] if metrics is not None else []
+    for kind, value in stream_chain(chain, {"question": arabic_prompt_for(question)}, callbacks):
+        if kind == "result":
+            remember_answer(chain, question, cache, value)
+        else:
+            yield kind, value
+
+def show_sources(documents):
+    with st.expander("المصادر"):
+        for doc in documents:
+            source = doc.metadata.get('source', 'N/A')
+            st.markdown(f"<p style='font-size: 16px;'><b>- المصدر:</b> {source}</p>", unsafe_allow_html=True)
+            st.write(f"   - {doc.page_content[:200]}...")
+            # Near-duplicate chunks of other guides were merged into this one
+            references = json.loads(doc.metadata.get("duplicate_sources", "[]"))
+            also = sorted({os.path.basename(ref["source"] or "") for ref in references} - {os.path.basename(source)})
+            if also:
+                st.write(f"   - ورد أيضاً في: {'، '.join(also)}")
 
 def main():
     st.markdown("""
@@ -97,31 +186,51 @@ def main():
     pdf_path = "/home/updog/ragllm/downloaded_pdfs"
     persist_directory = os.path.join("chroma_db", os.path.basename(pdf_path))
 
-    if not os.path.exists(persist_directory):
+    # Read on every rerun, so that the app moves to a version init_db published
+    store_directory = live_directory(persist_directory)
+    if store_directory is None:
         st.warning("No vector store exists. Please run `init_db.py` to create one.")
         return
     else:
         with st.spinner("جارٍ تحميل قاعدة البيانات المتجهة..."):
-            vectorstore = load_vectorstore(persist_directory, embeddings)
+            vectorstore = load_vectorstore(store_directory, TimedEmbeddings(embeddings, get_metrics()))
 
     if "memory" not in st.session_state:
-       st.session_state.memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True, output_key="answer")
+       st.session_state.memory = RollingSummaryMemory(llm=llm, memory_key="chat_history", return_messages=True, output_key="answer",
+                                                      max_turns=config.MEMORY_RECENT_TURNS, max_token_limit=config.MEMORY_TOKEN_LIMIT,
+                                                      token_counter=token_counter())
 
-    chain = setup_chain(vectorstore, llm, st.session_state.memory)
+    chain = setup_chain(vectorstore, llm, st.session_state.memory, build_retriever(vectorstore, store_directory))
 
     question = st.text_input("اطرح سؤالاً حول المستند:", placeholder="اكتب سؤالك هنا")
 
     if question:
-        with st.spinner("جارٍ إنشاء الإجابة..."):
-            response = query_documents(chain, question)
+        if config.STREAM_ANSWERS:
             st.markdown(f"<p style='font-size: 18px;'><b>الإجابة:</b></p>", unsafe_allow_html=True)
-            st.write(response["answer"])
-
-            with st.expander("المصادر"):
-                for doc in response["source_documents"]:
-                    source = doc.metadata.get('source', 'N/A')
-                    st.markdown(f"<p style='font-size: 16px;'><b>- المصدر:</b> {source}</p>", unsafe_allow_html=True)
-                    st.write(f"   - {doc.page_content[:200]}...")
+            answer_box = st.empty()
+            sources_box = st.container()
+            answer_box.markdown("جارٍ إنشاء الإجابة...")
+            answer = ""
+            events = stream_documents(chain, question, get_answer_cache(store_directory, embeddings), get_metrics())
+            for kind, value in events:
+                if kind == "sources":
+                    # Retrieval finishes before generation starts, show sources right away
+                    with sources_box:
+                        show_sources(value)
+                else:
+                    answer += value
+                    answer_box.markdown(answer + " ▌")
+            answer_box.markdown(answer)
+        else:
+            with st.spinner("جارٍ إنشاء الإجابة..."):
+                response = query_documents(chain, question, get_answer_cache(store_directory, embeddings), get_metrics())
+                st.markdown(f"<p style='font-size: 18px;'><b>الإجابة:</b></p>", unsafe_allow_html=True)
+                st.write(response["answer"])
+                show_sources(response["source_documents"])
+
+    with st.sidebar.expander("Latency"):
+        st.table(get_metrics().snapshot())
+        st.caption(f"Chat history tokens last turn: {st.session_state.memory.last_token_count}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""Retrieval benchmark: ingestion throughput, per-stage query latency and recall@k
+
+    python benchmark.py --pdfs fixtures/pdfs --questions benchmark_questions.json
+
+fixtures/pdfs is a small committed set of guides, one per labelled
+question plus distractors (rebuilt by fixtures/build_pdfs.py). The store
+is built from scratch in a temporary directory the way init_db builds it,
+near-duplicate removal and BM25 index included, and the LLM is a stub, so
+the benchmark runs offline and repeated runs are comparable. Questions go
+through the retriever the app builds from the same settings (RETRIEVER,
+RERANK); the raw dense search of Chroma and of the flat index, uncompressed
+and with each quantization mode, are measured alongside to compare their
+memory and recall@k.
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+import config
+from chunking import build_text_splitter
+from dedup import DedupIndex
+from flat_index import write_flat_index, FlatVectorStore
+from quantization import PQ_CLUSTERS
+from ingest import ingest_pdfs
+from lexical_index import build_lexical_index, lexical_index_path
+from pdf_parsing import list_pdfs
+from reranker import ScoreCache
+from retrieval import ARABIC_PROMPT_PREFIX, build_retriever
+
+
+def latency_summary(samples):
+    """p50/p95/p99 of durations in seconds, reported in milliseconds"""
+    if not samples:
+        return {}
+    values = np.asarray(samples) * 1000
+    return {name: round(float(np.percentile(values, q)), 2)
+            for name, q in (("p50", 50), ("p95", 95), ("p99", 99))}
+
+
+def label_matches(label, document):
+    """A label names the source file (any of several substrings), optionally a page and a text snippet"""
+    source = os.path.basename(document.metadata.get("source", ""))
+    if not any(name in source for name in label["source"]):
+        return False
+    if "page" in label and document.metadata.get("page") != label["page"]:
+        return False
+    if "text" in label and label["text"] not in document.page_content:
+        return False
+    return True
+
+
+def recall_at_k(labels, documents):
+    """Fraction of labelled answer chunks found among the retrieved documents"""
+    if not labels:
+        return None
+    found = sum(any(label_matches(label, document) for document in documents) for label in labels)
+    return found / len(labels)
+
+
+def build_store(pdf_dir, persist_directory, embeddings, workers=None):
+    """Ingest every PDF of pdf_dir with the configured chunking and dedup; returns the store and ingestion statistics"""
+    vectorstore = Chroma(persist_directory=persist_directory, embedding_function=embeddings)
+    dedup = DedupIndex(threshold=config.DEDUP_THRESHOLD) if config.DEDUP else None
+    files = pages = chunks = duplicates = 0
+    start = time.perf_counter()
+    for file_chunks in ingest_pdfs(list_pdfs(pdf_dir), vectorstore, embeddings,
+                                   build_text_splitter(), workers, dedup=dedup):
+        files += 1
+        pages += file_chunks.pages
+        chunks += len(file_chunks.ids)
+        duplicates += len(file_chunks.duplicates)
+    build_lexical_index(vectorstore, lexical_index_path(persist_directory))
+    elapsed = time.perf_counter() - start
+    return vectorstore, {
+        "files": files,
+        "pages": pages,
+        "chunks": chunks,
+        "duplicates_dropped": duplicates,
+        "seconds": round(elapsed, 2),
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else None,
+        "chunks_per_second": round(chunks / elapsed, 2) if elapsed else None,
+    }
+
+
+def answer_prompt(question, documents):
+    context = "\n\n".join(document.page_content for document in documents)
+    return (f"Use the following pieces of context to answer the question at the end.\n\n"
+            f"{context}\n\nQuestion: {question}\nHelpful Answer:")
+
+
+def mean_recalls(recalls):
+    """Mean recall@k per language and over all questions"""
+    means = {lang: round(sum(values) / len(values), 3) for lang, values in recalls.items()}
+    all_recalls = [value for values in recalls.values() for value in values]
+    if all_recalls:
+        means["all"] = round(sum(all_recalls) / len(all_recalls), 3)
+    return means
+
+
+def run_queries(search, embeddings, llm, questions, k):
+    """Time embed, search and LLM stages of every question and score recall@k
+
+    search(vector, k) returns the top-k documents for a query embedding.
+    """
+    timings = {"embed": [], "search": [], "llm": [], "total": []}
+    recalls = {}
+    for item in questions:
+        start = time.perf_counter()
+        vector = embeddings.embed_query(item["question"])
+        embedded = time.perf_counter()
+        documents = search(vector, k)
+        searched = time.perf_counter()
+        llm.invoke(answer_prompt(item["question"], documents))
+        answered = time.perf_counter()
+        timings["embed"].append(embedded - start)
+        timings["search"].append(searched - embedded)
+        timings["llm"].append(answered - searched)
+        timings["total"].append(answered - start)
+        recall = recall_at_k(item.get("relevant", []), documents)
+        if recall is not None:
+            recalls.setdefault(item.get("lang", "all"), []).append(recall)
+    report = {stage: latency_summary(samples) for stage, samples in timings.items()}
+    report["recall_at_k"] = mean_recalls(recalls)
+    return report
+
+
+def run_retriever_queries(retriever, llm, questions):
+    """Time retrieval (embedding included) and LLM stages of every question through a retriever and score recall@k"""
+    timings = {"retrieve": [], "llm": [], "total": []}
+    recalls = {}
+    for item in questions:
+        start = time.perf_counter()
+        # Prefixed as the app's chain sends it
+        documents = retriever.invoke(ARABIC_PROMPT_PREFIX + item["question"])
+        retrieved = time.perf_counter()
+        llm.invoke(answer_prompt(item["question"], documents))
+        answered = time.perf_counter()
+        timings["retrieve"].append(retrieved - start)
+        timings["llm"].append(answered - retrieved)
+        timings["total"].append(answered - start)
+        recall = recall_at_k(item.get("relevant", []), documents)
+        if recall is not None:
+            recalls.setdefault(item.get("lang", "all"), []).append(recall)
+    report = {stage: latency_summary(samples) for stage, samples in timings.items()}
+    report["recall_at_k"] = mean_recalls(recalls)
+    return report
+
+
+def neighbor_recall(exact_search, search, embeddings, questions, k):
+    """Fraction of the exact top-k chunks that search also returns, over all questions"""
+    found = total = 0
+    for item in questions:
+        vector = embeddings.embed_query(item["question"])
+        exact = {document.metadata.get("chunk_id") for document in exact_search(vector, k)}
+        found += len(exact & {document.metadata.get("chunk_id") for document in search(vector, k)})
+        total += len(exact)
+    return round(found / total, 3) if total else None
+
+
+def compare_quantization(vectorstore, work_dir, embeddings, llm, questions, k):
+    """Query the flat index uncompressed and quantized; returns query reports and memory figures"""
+    queries, memory = {}, {}
+    stores, skipped = {}, None
+    for mode in ("none", "int8", "pq"):
+        if mode == "pq" and len(stores["none"].ids) < PQ_CLUSTERS:
+            # Every vector would be its own centroid: no compression, no loss, nothing measured
+            skipped = f"{len(stores['none'].ids)} chunks, fewer than the {PQ_CLUSTERS} centroids per subspace"
+            continue
+        directory = os.path.join(work_dir, f"flat-{mode}")
+        write_flat_index(vectorstore, directory, dtype="float32", quantization=mode,
+                         pq_subspaces=config.PQ_SUBSPACES)
+        stores[mode] = FlatVectorStore(directory, embeddings, rescore_k=config.FLAT_INDEX_RESCORE_K)
+        queries[f"flat-{mode}"] = run_queries(
+            lambda vector, k, store=stores[mode]: store.similarity_search_by_vector(vector, k=k),
+            embeddings, llm, questions, k)
+
+    exact = stores["none"]
+    for mode, store in stores.items():
+        recall = queries[f"flat-{mode}"]["recall_at_k"].get("all")
+        baseline = queries["flat-none"]["recall_at_k"].get("all")
+        memory[f"flat-{mode}"] = {
+            "bytes": store.memory_bytes(),
+            "codebook_bytes": store.codebook_bytes(),
+            "reduction": round(exact.memory_bytes() / store.memory_bytes(), 1) if store.memory_bytes() else None,
+            "recall_loss": round(baseline - recall, 3) if recall is not None and baseline is not None else None,
+            "neighbor_recall": neighbor_recall(exact.similarity_search_by_vector,
+                                               store.similarity_search_by_vector, embeddings, questions, k),
+        }
+    if skipped:
+        memory["flat-pq"] = {"skipped": skipped}
+    return queries, memory
+
+
+def print_report(report):
+    ingestion = report["ingestion"]
+    print(f"ingestion: {ingestion['files']} files, {ingestion['pages']} pages, {ingestion['chunks']} chunks "
+          f"({ingestion['duplicates_dropped']} near-duplicates dropped) "
+          f"in {ingestion['seconds']}s ({ingestion['pages_per_second']} pages/s, "
+          f"{ingestion['chunks_per_second']} chunks/s)")
+    for name, queries in report["queries"].items():
+        print(f"\n[{name}] k={report['k']}")
+        for stage in ("retrieve", "embed", "search", "llm", "total"):
+            if stage not in queries:
+                continue
+            summary = queries[stage]
+            print(f"  {stage:<7} " + "  ".join(f"{key}={value}ms" for key, value in summary.items()))
+        print("  recall@k " + "  ".join(f"{lang}={value}" for lang, value in queries["recall_at_k"].items()))
+    if report.get("memory"):
+        print("\nvector memory (vs. float32 flat index)")
+        for name, memory in report["memory"].items():
+            if "skipped" in memory:
+                print(f"  {name:<10} skipped: {memory['skipped']}")
+                continue
+            codebooks = f" + {memory['codebook_bytes'] / 2 ** 20:.2f} MiB codebooks" if memory["codebook_bytes"] else ""
+            print(f"  {name:<10} {memory['bytes'] / 2 ** 20:.2f} MiB{codebooks}  x{memory['reduction']} smaller  "
+                  f"recall@k loss={memory['recall_loss']}  exact top-k overlap={memory['neighbor_recall']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdfs", default=os.path.join("fixtures", "pdfs"), help="directory of fixture PDFs")
+    parser.add_argument("--questions", default="benchmark_questions.json", help="labelled question set")
+    parser.add_argument("--k", type=int, default=config.RETRIEVAL_K)
+    parser.add_argument("--workers", type=int, default=None, help="PDF parsing processes")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    with open(args.questions, encoding="utf-8") as f:
+        questions = json.load(f)
+
+    with tempfile.TemporaryDirectory(prefix="ragllm-bench-") as work_dir:
+        # A fresh embedding cache so that encoding time is actually measured
+        config.EMBEDDING_CACHE_PATH = os.path.join(work_dir, "embedding_cache.sqlite3")
+        from embedding_engine import build_embeddings
+
+        embeddings = build_embeddings()
+        persist_directory = os.path.join(work_dir, "chroma")
+        vectorstore, ingestion = build_store(args.pdfs, persist_directory, embeddings, args.workers)
+        llm = FakeListChatModel(responses=["stub answer"])
+        report = {"k": args.k, "ingestion": ingestion, "queries": {}}
+        reranker = None
+        if config.RERANK:
+            from sentence_transformers import CrossEncoder
+            reranker = (CrossEncoder(config.RERANK_MODEL, device='cpu'), ScoreCache())
+        retriever = build_retriever(vectorstore, persist_directory, reranker, k=args.k)
+        name = f"app retriever: {config.RETRIEVER}" + (", reranked" if config.RERANK else "")
+        report["queries"][name] = run_retriever_queries(retriever, llm, questions)
+        report["queries"]["chroma dense"] = run_queries(
+            lambda vector, k: vectorstore.similarity_search_by_vector(vector, k=k),
+            embeddings, llm, questions, args.k)
+        flat_queries, report["memory"] = compare_quantization(vectorstore, work_dir, embeddings, llm,
+                                                              questions, args.k)
+        report["queries"].update(flat_queries)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
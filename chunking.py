@@ -0,0 +1,232 @@
+import re
+import math
+import threading
+from langchain.text_splitter import RecursiveCharacterTextSplitter, TextSplitter
+import config
+
+# Sentence ends, Arabic question mark and semicolon included; clause breaks split overlong sentences
+_SENTENCE_END = re.compile(r"(?<=[.!?؟؛])\s+")
+_CLAUSE_END = re.compile(r"(?<=[،,;:])\s+")
+_LINE_END_PUNCTUATION = tuple(".!?؟؛،,")
+_WORD_PIECE = re.compile(r"\w+|[^\w\s]")
+
+# Stores whose manifest predates splitter signatures were chunked like this
+LEGACY_SPLITTER_SIGNATURE = "RecursiveCharacterTextSplitter:1000:200:len"
+
+
+def estimate_tokens(text):
+    """Rough word-piece count: a piece per 3 letters of each word, one per punctuation mark"""
+    return sum(math.ceil(len(piece) / 3) for piece in _WORD_PIECE.findall(text))
+
+
+class TokenCounter:
+    """Length function counting the embedding model's word-pieces
+
+    The model's pre-tokenizer splits on whitespace before word-pieces are
+    assigned, so a text's count is the sum of its words' counts. Words are
+    tokenized once, in batches through the fast tokenizer, and their counts
+    are cached; repeated calls while packing a chunk are dictionary lookups.
+    The tokenizer is loaded on first use.
+    """
+
+    def __init__(self, model_name, cache_size=500000):
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self._tokenizer = None
+        self._words = {}
+        self._lock = threading.RLock()
+
+    @property
+    def __name__(self):
+        return f"tokens[{self.model_name}]"
+
+    @property
+    def tokenizer(self):
+        with self._lock:
+            if self._tokenizer is None:
+                from transformers import AutoTokenizer
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+            return self._tokenizer
+
+    @property
+    def special_tokens(self):
+        """Tokens the model adds around every input"""
+        return self.tokenizer.num_special_tokens_to_add()
+
+    def __call__(self, text):
+        words = text.split()
+        cache = self._words
+        if len(cache) > self.cache_size:
+            cache = self._words = {}
+        missing = list({word for word in words if word not in cache})
+        if missing:
+            # Fast tokenizers must not be called from two threads at once
+            with self._lock:
+                counts = self.tokenizer(missing, add_special_tokens=False)["input_ids"]
+            cache.update(zip(missing, map(len, counts)))
+        return sum(cache[word] for word in words)
+
+
+_token_counters = {}
+
+
+def token_counter(model_name=None):
+    """The shared TokenCounter of a model, the embedding model by default"""
+    model_name = model_name or config.EMBEDDING_MODEL
+    if model_name not in _token_counters:
+        _token_counters[model_name] = TokenCounter(model_name)
+    return _token_counters[model_name]
+
+
+def truncated_chunks(chunks, max_tokens=None):
+    """Chunks longer than the embedding model reads; their tail is silently dropped at embedding time"""
+    counter = token_counter()
+    limit = (max_tokens or config.EMBEDDING_MAX_TOKENS) - counter.special_tokens
+    return [chunk for chunk in chunks if counter(chunk.page_content) > limit]
+
+
+def is_heading(line, max_words=8, max_chars=60):
+    """Short standalone lines that do not end like a sentence: titles of guide sections"""
+    return 0 < len(line) <= max_chars and len(line.split()) <= max_words and not line.endswith(_LINE_END_PUNCTUATION)
+
+
+class StructuredTextSplitter(TextSplitter):
+    """Splits pages into chunks along headings and sentences, sized in tokens
+
+    Each page is split on its own, so chunks never span pages. Within a
+    page, a heading starts a new chunk unless the current one is still under
+    half full and has room for the heading's first sentence; headings with
+    nothing in between stay together, so a chunk never ends with a heading.
+    Chunks are packed from whole sentences (split on . ! ? ؟ ؛). Only
+    sentences longer than a chunk are cut, at clause marks (، , ; :) and
+    then between words. Continuation chunks repeat their section heading
+    and carry at most chunk_overlap tokens of trailing sentences.
+    """
+
+    def __init__(self, chunk_size=256, chunk_overlap=32, length_function=estimate_tokens, **kwargs):
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap,
+                         length_function=length_function, **kwargs)
+
+    def _sections(self, text):
+        """(heading, body) pairs; wrapped lines of a body are joined back together"""
+        sections = []
+        heading, body = None, []
+        lines = [line.strip() for line in text.splitlines()]
+        for i, line in enumerate(lines):
+            if not line:
+                continue
+            followed = any(lines[i + 1:])
+            if followed and is_heading(line):
+                if heading is not None or body:
+                    sections.append((heading, " ".join(body)))
+                heading, body = line, []
+            else:
+                body.append(line)
+        if heading is not None or body:
+            sections.append((heading, " ".join(body)))
+        return sections
+
+    def _pieces(self, text, patterns, size):
+        """Cut text at the first pattern that applies, recursing until pieces fit in size tokens"""
+        if self._length_function(text) <= size:
+            return [text]
+        if not patterns:
+            words = text.split()
+            pieces, current = [], []
+            for word in words:
+                if current and self._length_function(" ".join(current + [word])) > size:
+                    pieces.append(" ".join(current))
+                    current = []
+                current.append(word)
+            if current:
+                pieces.append(" ".join(current))
+            return pieces
+        pieces = []
+        for part in patterns[0].split(text):
+            if part.strip():
+                pieces.extend(self._pieces(part.strip(), patterns[1:], size))
+        return pieces
+
+    def split_text(self, text):
+        chunks = []
+        current, size = [], 0
+        heading = None
+        for section_heading, body in self._sections(text):
+            heading_tokens = self._length_function(section_heading) if section_heading else 0
+            # Pieces leave room for the heading every chunk of the section starts with
+            room = max(1, self._chunk_size - heading_tokens)
+            sentences = self._pieces(body, [_SENTENCE_END, _CLAUSE_END], room) if body else []
+            if section_heading is not None:
+                # A heading never ends a chunk: it goes where its first sentence fits
+                first_tokens = self._length_function(sentences[0]) if sentences else 0
+                if self._has_body(current) and (size >= self._chunk_size // 2
+                                                or size + heading_tokens + first_tokens > self._chunk_size):
+                    chunks.append(self._join(current))
+                    current, size = [], 0
+                heading = section_heading
+                current.append((section_heading, True))
+                size += heading_tokens
+                if first_tokens and size + first_tokens > self._chunk_size:
+                    # Only after stacked headings: cut the first sentence to what they leave
+                    sentences[:1] = self._pieces(sentences[0], [_CLAUSE_END], max(1, self._chunk_size - size))
+            for sentence in sentences:
+                tokens = self._length_function(sentence)
+                if self._has_body(current) and size + tokens > self._chunk_size:
+                    chunks.append(self._join(current))
+                    current, size = self._overlap(current, heading, heading_tokens, self._chunk_size - tokens)
+                current.append((sentence, False))
+                size += tokens
+        if current:
+            chunks.append(self._join(current))
+        return [chunk for chunk in chunks if chunk]
+
+    def _overlap(self, units, heading, heading_tokens, room):
+        """Start of the next chunk: the section heading and trailing sentences within chunk_overlap
+
+        room is what the next sentence leaves free in the chunk.
+        """
+        carried, size = [], 0
+        budget = min(self._chunk_overlap, room - heading_tokens)
+        for text, is_heading_unit in reversed(units):
+            if is_heading_unit:
+                break
+            tokens = self._length_function(text)
+            if size + tokens > budget:
+                break
+            carried.insert(0, (text, False))
+            size += tokens
+        if heading is not None:
+            carried.insert(0, (heading, True))
+            size += heading_tokens
+        return carried, size
+
+    @staticmethod
+    def _has_body(units):
+        return any(not is_heading_unit for _, is_heading_unit in units)
+
+    @staticmethod
+    def _join(units):
+        """Headings on their own line, sentences of a paragraph joined by spaces"""
+        lines = []
+        for text, is_heading_unit in units:
+            if is_heading_unit or not lines or lines[-1][1]:
+                lines.append([text, is_heading_unit])
+            else:
+                lines[-1][0] += " " + text
+        return "\n".join(text for text, _ in lines).strip()
+
+
+def splitter_signature(text_splitter):
+    """Identifies the chunking settings; chunks made with other settings need re-splitting"""
+    length_function = getattr(text_splitter._length_function, "__name__", type(text_splitter._length_function).__name__)
+    return f"{type(text_splitter).__name__}:{text_splitter._chunk_size}:{text_splitter._chunk_overlap}:{length_function}"
+
+
+def build_text_splitter():
+    """The splitter shared by ingestion, the app and the benchmark"""
+    if config.CHUNKER == "recursive":
+        return RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, length_function=len)
+    # Sized in the embedding model's tokens, or with the rough estimate
+    length_function = token_counter() if config.CHUNK_LENGTH == "tokenizer" else estimate_tokens
+    return StructuredTextSplitter(chunk_size=config.CHUNK_TOKENS, chunk_overlap=config.CHUNK_OVERLAP_TOKENS,
+                                  length_function=length_function)
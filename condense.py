@@ -0,0 +1,82 @@
+import re
+import numpy as np
+from typing import Any, Optional
+from langchain.chains import ConversationalRetrievalChain
+from langchain_core.embeddings import Embeddings
+
+# Words that point back at earlier turns (Arabic, French, English). Pronouns
+# that mostly appear in question forms ("ما هي", "faut-il", "qu'est-ce") are left out.
+REFERENCE_WORDS = {
+    "هذا", "هذه", "ذلك", "تلك", "هؤلاء", "أولئك",
+    "نفس", "نفسه", "نفسها", "ذاته", "أيضا", "أيضاً", "كذلك", "السابق", "السابقة", "المذكور", "المذكورة",
+    "cela", "ça", "celui", "celle", "ceux", "celles", "elle", "elles",
+    "même", "aussi", "précédent", "précédente",
+    "it", "this", "that", "these", "those", "they", "them", "same", "also",
+}
+# Openers of elliptical follow-ups such as "وماذا عن الماعز؟" or "et pour les chèvres ?"
+FOLLOW_UP_OPENERS = ("وماذا عن", "ماذا عن", "وماذا", "وكيف", "وهل", "et pour", "et si", "et les", "what about", "and ")
+
+_WORD = re.compile(r"\w+")
+
+
+def _words(text):
+    words = []
+    for word in _WORD.findall(text.casefold()):
+        words.append(word)
+        # Arabic conjunction proclitics: "وهذا", "فذلك"
+        if len(word) > 2 and word[0] in "وف":
+            words.append(word[1:])
+    return words
+
+
+def _last_question(chat_history):
+    for message in reversed(chat_history):
+        if isinstance(message, tuple):
+            return message[0]
+        if getattr(message, "type", None) == "human":
+            return message.content
+    return None
+
+
+class SelectiveCondenseChain(ConversationalRetrievalChain):
+    """ConversationalRetrievalChain that only condenses follow-ups that need it
+
+    The condense LLM call is skipped on the first turn, and on later turns
+    when the question neither uses a reference word or follow-up opener,
+    nor is very short, nor is close in embedding space to the previous
+    question. Such questions are retrieved and answered as asked.
+    """
+
+    embeddings: Optional[Embeddings] = None
+    question_prefix: str = ""
+    similarity_threshold: float = 0.55
+    short_question_words: int = 3
+
+    def _strip(self, question):
+        if self.question_prefix and question.startswith(self.question_prefix):
+            return question[len(self.question_prefix):]
+        return question
+
+    def needs_condense(self, question, chat_history):
+        previous = _last_question(chat_history) if chat_history else None
+        if previous is None:
+            return False
+        question = self._strip(question).strip()
+        words = _words(question)
+        if len(words) <= self.short_question_words:
+            return True
+        if REFERENCE_WORDS.intersection(words) or question.casefold().startswith(FOLLOW_UP_OPENERS):
+            return True
+        if self.embeddings is None:
+            return False
+        # Queries go through the embedding cache, so each question is encoded once
+        vectors = np.asarray([self.embeddings.embed_query(question),
+                              self.embeddings.embed_query(self._strip(previous).strip())])
+        norms = np.linalg.norm(vectors, axis=1)
+        similarity = float(vectors[0] @ vectors[1] / (norms[0] * norms[1])) if norms.all() else 0.0
+        return similarity >= self.similarity_threshold
+
+    def _call(self, inputs: dict[str, Any], run_manager=None) -> dict[str, Any]:
+        if not self.needs_condense(inputs["question"], inputs["chat_history"]):
+            inputs = {**inputs, "chat_history": []}
+        return super()._call(inputs, run_manager=run_manager)
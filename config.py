@@ -0,0 +1,65 @@
+import os
+
+# Embeddings
+EMBEDDING_MODEL = os.environ.get("EMBEDDING_MODEL", "sentence-transformers/all-mpnet-base-v2")
+EMBEDDING_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", "32"))
+EMBEDDING_CACHE_PATH = os.environ.get("EMBEDDING_CACHE_PATH", os.path.join("chroma_db", "embedding_cache.sqlite3"))
+# "torch" (sentence-transformers) or "onnx" (ONNX Runtime, optionally int8)
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch")
+EMBEDDING_QUANTIZE = os.environ.get("EMBEDDING_QUANTIZE", "0") == "1"
+ONNX_EXPORT_DIR = os.environ.get("ONNX_EXPORT_DIR", os.path.join("models", "all-mpnet-base-v2-onnx"))
+
+# Chunking: "structured" (headings and sentences, sized in tokens) or "recursive" (1000 characters)
+CHUNKER = os.environ.get("CHUNKER", "structured")
+CHUNK_TOKENS = int(os.environ.get("CHUNK_TOKENS", "256"))
+CHUNK_OVERLAP_TOKENS = int(os.environ.get("CHUNK_OVERLAP_TOKENS", "32"))
+# "tokenizer" (the embedding model's word-pieces) or "estimate" (no tokenizer needed)
+CHUNK_LENGTH = os.environ.get("CHUNK_LENGTH", "tokenizer")
+# Word-pieces the embedding model reads, special tokens included; the rest of a chunk is dropped
+EMBEDDING_MAX_TOKENS = int(os.environ.get("EMBEDDING_MAX_TOKENS", "384"))
+
+# Drop chunks whose MinHash Jaccard similarity with a stored chunk reaches DEDUP_THRESHOLD
+DEDUP = os.environ.get("DEDUP", "1") == "1"
+DEDUP_THRESHOLD = float(os.environ.get("DEDUP_THRESHOLD", "0.8"))
+
+# init_db saves its progress every CHECKPOINT_FILES PDFs; an interrupted run resumes from there
+CHECKPOINT_FILES = int(os.environ.get("CHECKPOINT_FILES", "20"))
+
+# Vector index served by the app: "chroma", or "flat" (memory-mapped, read-only, written by init_db)
+VECTOR_INDEX = os.environ.get("VECTOR_INDEX", "chroma")
+FLAT_INDEX_DTYPE = os.environ.get("FLAT_INDEX_DTYPE", "float16")
+# Compressed codes searched in memory: "none", "pq" (product quantization) or "int8";
+# the best FLAT_INDEX_RESCORE_K candidates are re-scored from the full vectors on disk
+FLAT_INDEX_QUANTIZATION = os.environ.get("FLAT_INDEX_QUANTIZATION", "none")
+PQ_SUBSPACES = int(os.environ.get("PQ_SUBSPACES", "96"))
+FLAT_INDEX_RESCORE_K = int(os.environ.get("FLAT_INDEX_RESCORE_K", "50"))
+
+# Retrieval: "hybrid" (BM25 + dense, fused with RRF) or "dense"
+RETRIEVER = os.environ.get("RETRIEVER", "hybrid")
+RETRIEVAL_K = int(os.environ.get("RETRIEVAL_K", "3"))
+HYBRID_FETCH_K = int(os.environ.get("HYBRID_FETCH_K", "20"))
+
+# Cross-encoder reranking of RERANK_FETCH_K candidates, within RERANK_TIME_BUDGET seconds
+RERANK = os.environ.get("RERANK", "0") == "1"
+RERANK_MODEL = os.environ.get("RERANK_MODEL", "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1")
+RERANK_FETCH_K = int(os.environ.get("RERANK_FETCH_K", "30"))
+RERANK_BATCH_SIZE = int(os.environ.get("RERANK_BATCH_SIZE", "8"))
+RERANK_TIME_BUDGET = float(os.environ.get("RERANK_TIME_BUDGET", "0.5"))
+
+# Render answers token by token as the LLM generates them
+STREAM_ANSWERS = os.environ.get("STREAM_ANSWERS", "1") == "1"
+
+# Follow-ups at least this similar to the previous question are condensed with the history
+CONDENSE_SIMILARITY_THRESHOLD = float(os.environ.get("CONDENSE_SIMILARITY_THRESHOLD", "0.55"))
+
+# Conversation memory: recent turns kept verbatim and their token budget
+MEMORY_RECENT_TURNS = int(os.environ.get("MEMORY_RECENT_TURNS", "3"))
+MEMORY_TOKEN_LIMIT = int(os.environ.get("MEMORY_TOKEN_LIMIT", "1200"))
+
+# Answer cache
+ANSWER_CACHE_SIZE = int(os.environ.get("ANSWER_CACHE_SIZE", "512"))
+ANSWER_CACHE_TTL = float(os.environ.get("ANSWER_CACHE_TTL", "3600"))
+ANSWER_CACHE_THRESHOLD = float(os.environ.get("ANSWER_CACHE_THRESHOLD", "0.95"))
+
+# Instrumentation: serve Prometheus metrics on this port when set
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0"))
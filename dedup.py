@@ -0,0 +1,157 @@
+import os
+import re
+import json
+import hashlib
+import numpy as np
+from lexical_index import normalize
+
+_WORD = re.compile(r"\w+")
+
+
+def dedup_index_path(persist_directory):
+    """The MinHash index lives next to the Chroma directory it describes"""
+    return os.path.normpath(persist_directory) + ".dedup.npz"
+
+
+def shingles(text, size=5):
+    """Word 5-grams of the normalized text; a short text is one shingle"""
+    words = _WORD.findall(normalize(text))
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class DedupIndex:
+    """MinHash signatures of the stored chunks, banded for LSH lookups
+
+    A chunk is a near-duplicate of a stored one when they share an LSH band
+    and their signatures agree on at least threshold of the hashes, an
+    estimate of the Jaccard similarity of their shingles.
+    """
+
+    def __init__(self, num_perm=64, bands=8, threshold=0.8, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"{num_perm} hashes cannot be split into {bands} bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing of 32-bit shingle hashes, one odd multiplier per permutation
+        self._a = rng.integers(1, 1 << 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, num_perm, dtype=np.uint64)
+        self.ids = []
+        self.signatures = []
+        self.buckets = {}
+        self.removed = set()
+
+    def signature(self, text):
+        hashes = np.fromiter((int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+                              for shingle in shingles(text)), dtype=np.uint64)
+        if not len(hashes):
+            return np.zeros(self.num_perm, dtype=np.uint32)
+        return ((hashes[:, None] * self._a + self._b) >> np.uint64(32)).min(0).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        rows = self.num_perm // self.bands
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def find(self, signature):
+        """ID of a stored chunk that signature nearly duplicates, or None"""
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        best, best_similarity = None, self.threshold
+        for row in candidates:
+            if self.ids[row] in self.removed:
+                continue
+            similarity = float(np.mean(self.signatures[row] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = self.ids[row], similarity
+        return best
+
+    def add(self, chunk_id, signature):
+        row = len(self.ids)
+        self.ids.append(chunk_id)
+        self.signatures.append(signature)
+        self.removed.discard(chunk_id)
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, []).append(row)
+
+    def remove(self, chunk_ids):
+        self.removed.update(chunk_ids)
+
+    def save(self, path):
+        """Write the live signatures atomically"""
+        rows = [row for row, chunk_id in enumerate(self.ids) if chunk_id not in self.removed]
+        signatures = np.asarray([self.signatures[row] for row in rows], dtype=np.uint32).reshape(-1, self.num_perm)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, ids=np.asarray([self.ids[row] for row in rows], dtype=str), signatures=signatures,
+                 params=np.asarray([self.num_perm, self.bands]), threshold=np.asarray(self.threshold))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, threshold=0.8):
+        """The saved index, or None if there is none or it was made with other parameters"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            num_perm, bands = (int(value) for value in data["params"])
+            if float(data["threshold"]) != threshold:
+                return None
+            index = cls(num_perm, bands, threshold)
+            for chunk_id, signature in zip(data["ids"], data["signatures"]):
+                index.add(str(chunk_id), signature)
+        return index
+
+    @classmethod
+    def build(cls, vectorstore, threshold=0.8, page_size=1000):
+        """Index every chunk stored in a Chroma vector store"""
+        index = cls(threshold=threshold)
+        offset = 0
+        while True:
+            page = vectorstore.get(include=["documents"], limit=page_size, offset=offset)
+            for chunk_id, text in zip(page["ids"], page["documents"]):
+                index.add(chunk_id, index.signature(text))
+            if len(page["ids"]) < page_size:
+                break
+            offset += page_size
+        return index
+
+
+def _update_back_references(vectorstore, chunk_ids, update):
+    if not chunk_ids:
+        return
+    found = vectorstore.get(ids=list(chunk_ids), include=["metadatas"])
+    ids, metadatas = [], []
+    for chunk_id, metadata in zip(found["ids"], found["metadatas"]):
+        metadata = dict(metadata or {})
+        references = json.loads(metadata.get("duplicate_sources", "[]"))
+        new_references = update(chunk_id, references)
+        if new_references == references:
+            continue
+        metadata["duplicate_sources"] = json.dumps(new_references, ensure_ascii=False)
+        ids.append(chunk_id)
+        metadatas.append(metadata)
+    if ids:
+        vectorstore._collection.update(ids=ids, metadatas=metadatas)
+
+
+def add_back_references(vectorstore, references):
+    """Record on each kept chunk the {source, page} of the duplicates dropped in its favour
+
+    Stored as a JSON string, Chroma metadata values being scalars.
+    """
+    def update(chunk_id, existing):
+        merged = list(existing)
+        for reference in references[chunk_id]:
+            if reference not in merged:
+                merged.append(reference)
+        return merged
+
+    _update_back_references(vectorstore, references, update)
+
+
+def drop_back_references(vectorstore, chunk_ids, source):
+    """Forget the duplicates that source contributed to the given kept chunks"""
+    _update_back_references(vectorstore, chunk_ids,
+                            lambda chunk_id, existing: [ref for ref in existing if ref["source"] != source])
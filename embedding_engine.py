@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import hashlib
+import threading
+from array import array
+from langchain_core.embeddings import Embeddings
+from langchain_huggingface import HuggingFaceEmbeddings
+import config
+
+
+def text_key(kind, text):
+    """Cache key of a text; queries and documents are kept apart"""
+    return kind + ":" + hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk float32 vectors keyed by (model name, text hash)"""
+
+    def __init__(self, path, model_name):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.model_name = model_name
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, key TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, key))"
+        )
+        self.conn.commit()
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(keys)
+        with self.lock:
+            # Stay below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({','.join('?' * len(part))})",
+                    [self.model_name, *part],
+                )
+                for key, blob in rows:
+                    found[key] = array('f', blob).tolist()
+        return found
+
+    def put_many(self, items):
+        rows = [(self.model_name, key, array('f', vector).tobytes()) for key, vector in items]
+        with self.lock:
+            self.conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper adding a persistent cache and length-sorted batching
+
+    Only texts missing from the cache are encoded. They are sorted by length
+    before being cut into batches, so each batch pads to similar lengths.
+    """
+
+    def __init__(self, embeddings, model_name, cache_path, batch_size=32):
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_path, model_name)
+
+    def _embed(self, kind, texts, encode):
+        keys = [text_key(kind, text) for text in texts]
+        vectors = self.cache.get_many(set(keys))
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing[key] = text
+        pending = sorted(missing.items(), key=lambda item: len(item[1]))
+        for i in range(0, len(pending), self.batch_size):
+            batch = pending[i:i + self.batch_size]
+            encoded = encode([text for _, text in batch])
+            # Round through float32 so fresh and cached vectors are identical
+            new = [(key, array('f', vector).tolist()) for (key, _), vector in zip(batch, encoded)]
+            self.cache.put_many(new)
+            vectors.update(new)
+        return [list(vectors[key]) for key in keys]
+
+    def embed_documents(self, texts):
+        return self._embed("doc", texts, self.embeddings.embed_documents)
+
+    def embed_query(self, text):
+        return self._embed("query", [text], lambda batch: [self.embeddings.embed_query(batch[0])])[0]
+
+
+def build_embeddings():
+    """The configured embedding backend behind the on-disk cache"""
+    if config.EMBEDDING_BACKEND == "onnx":
+        from onnx_embeddings import OnnxEmbeddings
+
+        embeddings = OnnxEmbeddings(config.EMBEDDING_MODEL, config.ONNX_EXPORT_DIR,
+                                    quantize=config.EMBEDDING_QUANTIZE,
+                                    batch_size=config.EMBEDDING_BATCH_SIZE)
+        # Vectors differ slightly between backends, keep their cache entries apart
+        cache_name = config.EMBEDDING_MODEL + ("@onnx-int8" if config.EMBEDDING_QUANTIZE else "@onnx")
+    elif config.EMBEDDING_BACKEND == "torch":
+        embeddings = HuggingFaceEmbeddings(model_name=config.EMBEDDING_MODEL,
+                                           model_kwargs={'device': 'cpu'},
+                                           encode_kwargs={'batch_size': config.EMBEDDING_BATCH_SIZE})
+        cache_name = config.EMBEDDING_MODEL
+    else:
+        raise ValueError(f"Unknown embedding backend: {config.EMBEDDING_BACKEND}")
+    return CachedEmbeddings(embeddings, cache_name, config.EMBEDDING_CACHE_PATH,
+                            batch_size=config.EMBEDDING_BATCH_SIZE)
@@ -0,0 +1,81 @@
+"""Build the benchmark's fixture PDFs from guides.json
+
+    python fixtures/build_pdfs.py
+
+guides.json maps a file name to its pages, each a list of headings and
+paragraphs; paragraphs are wrapped onto several lines, as in the real
+guides. No font is embedded: character codes map to Unicode through a
+ToUnicode CMap, so viewers show placeholder glyphs but text extraction,
+all ingestion reads, returns the text exactly. Lines are stored in visual
+order, right to left, as Arabic PDFs are and as pypdf expects. The output
+is deterministic, so rebuilding leaves the committed files unchanged.
+"""
+import os
+import json
+import textwrap
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def page_lines(blocks, width=75):
+    lines = []
+    for block in blocks:
+        lines.extend(textwrap.wrap(block, width) or [""])
+    return lines
+
+
+def pdf_bytes(pages):
+    """A PDF of the given pages of text lines, with one font mapped to the characters used"""
+    codes = {" ": 0x20}
+    code = 0x21
+    for char in sorted({char for lines in pages for line in lines for char in line} - {" "}):
+        codes[char] = code
+        code = 0xA1 if code == 0x7E else code + 1
+    if code > 0x100:
+        raise ValueError("too many distinct characters for a single-byte font")
+    mappings = "\n".join(f"<{code:02X}> <{ord(char):04X}>" for char, code in sorted(codes.items(), key=lambda item: item[1]))
+    cmap = ("/CIDInit /ProcSet findresource begin 12 dict begin begincmap\n"
+            "/CMapName /Fixture def /CMapType 2 def\n1 begincodespacerange <00> <FF> endcodespacerange\n"
+            f"{len(codes)} beginbfchar\n{mappings}\nendbfchar\n"
+            "endcmap CMapName currentdict /CMap defineresource pop end end").encode()
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /ToUnicode 4 0 R >>",
+        4: b"<< /Length %d >>\nstream\n" % len(cmap) + cmap + b"\nendstream",
+    }
+    kids = []
+    for i, lines in enumerate(pages):
+        page, content = 5 + 2 * i, 6 + 2 * i
+        kids.append(f"{page} 0 R")
+        shown = " ".join("<" + "".join(f"{codes[char]:02X}" for char in line[::-1]) + "> Tj T*" for line in lines)
+        stream = f"BT /F1 11 Tf 40 800 Td 16 TL {shown} ET".encode()
+        objects[page] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {content} 0 R "
+                         f"/Resources << /Font << /F1 3 0 R >> >> >>").encode()
+        objects[content] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out = b"%PDF-1.4\n"
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[number] for number in sorted(objects))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+def main():
+    with open(os.path.join(HERE, "guides.json"), encoding="utf-8") as f:
+        guides = json.load(f)
+    out_dir = os.path.join(HERE, "pdfs")
+    os.makedirs(out_dir, exist_ok=True)
+    for name, pages in guides.items():
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(pdf_bytes([page_lines(blocks) for blocks in pages]))
+    print(f"{len(guides)} PDFs written to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Check that the structured splitter never emits a chunk made only of headings
+
+    python fixtures/check_chunks.py
+
+Splits the pages of fixtures/pdfs, a title followed by a section whose
+first sentence fills a chunk, and seeded random pages with stacked
+headings and overlong sentences, at several chunk sizes. Chunks are
+checked from the units the splitter joins, so a body piece that happens
+to read like a heading is not mistaken for one.
+
+Exits with an error on the first chunk that fails.
+"""
+import os
+import sys
+import random
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from langchain_community.document_loaders import PyPDFLoader  # noqa: E402
+from chunking import StructuredTextSplitter  # noqa: E402
+
+CHUNK_SIZES = (16, 32, 64, 128, 256)
+WORDS = "القمح الزيتون التربة الماء البذور الحصاد الفلاح الأغنام النحل الري الأسمدة الآفات".split()
+HEADING_WORDS = "مقدمة التسميد المكافحة التخزين الخلاصة الفصل".split()
+
+
+class RecordingSplitter(StructuredTextSplitter):
+    """Keeps the (text, is heading) units of every chunk it joins"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.joined = []
+
+    def _join(self, units):
+        self.joined.append(list(units))
+        return super()._join(units)
+
+
+def random_page(rng):
+    lines = []
+    for _ in range(rng.randint(1, 6)):
+        for _ in range(rng.randint(1, 3)):
+            lines.append(" ".join(rng.choice(HEADING_WORDS) for _ in range(rng.randint(1, 3))))
+        for _ in range(rng.randint(1, 4)):
+            words = [rng.choice(WORDS) for _ in range(rng.choice((4, 12, 40, 150)))]
+            lines.append(" ".join(words) + rng.choice((".", "،", "؟")))
+    return "\n".join(lines)
+
+
+def pages():
+    pdf_dir = os.path.join(HERE, "pdfs")
+    for name in sorted(os.listdir(pdf_dir)):
+        for page in PyPDFLoader(os.path.join(pdf_dir, name)).load():
+            yield name, page.page_content
+    long_sentence = " ".join(["تعتبر زراعة القمح من أهم الزراعات حيث يعتمد عليها الفلاح"] * 30) + "."
+    yield "title and first section", f"دليل زراعة القمح\nمقدمة\n{long_sentence}\nالتربة\nيحتاج القمح إلى تربة جيدة."
+    rng = random.Random(17)
+    for i in range(300):
+        yield f"random page {i}", random_page(rng)
+
+
+def main():
+    checked = 0
+    for name, text in pages():
+        for chunk_size in CHUNK_SIZES:
+            splitter = RecordingSplitter(chunk_size=chunk_size, chunk_overlap=chunk_size // 8)
+            splitter.split_text(text)
+            for units in splitter.joined:
+                if all(is_heading for _, is_heading in units):
+                    sys.exit(f"FAILED: {name} at chunk_size={chunk_size}: a chunk of headings only: "
+                             f"{[text for text, _ in units]}")
+            checked += len(splitter.joined)
+    print(f"ok: none of {checked} chunks is made only of headings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Crawl a local copy of the site to check discovery and the download pipeline offline
+
+    python fixtures/crawl_site.py
+
+Serves fixtures/site (main page, paginated category listings and article
+pages, ids 40-48) and the PDFs of fixtures/pdfs with http.server, then
+runs the scraper against it in a temporary directory:
+
+- a first crawl of the category listings, with page 2 of category 1
+  answering 503, must find every other article once, whatever the
+  duplicates and URL spellings, download their PDFs and record the page;
+- a second crawl must retry that page and walk category 1 to its end;
+- a third must stop paging at the first listing page without a new
+  article and find every PDF unchanged (If-Modified-Since), and a full
+  discovery walk must fetch every listing page again;
+- the main-page mode must fetch the articles linked there.
+
+Exits with an error on the first check that fails.
+"""
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from get_pdfs import ArticleScraper  # noqa: E402
+from transport import Transport  # noqa: E402
+
+SITE = os.path.join(HERE, "site")
+CATEGORY_IDS = (1, 2, 3)
+ARTICLE_IDS = {str(i) for i in range(40, 49)}
+PDF_ARTICLES = 8
+FAILING_PAGE = "/articles/categories?id=1&page=2"
+
+
+class SiteHandler(SimpleHTTPRequestHandler):
+    """Map the site's URLs, query string included, to the fixture files"""
+
+    requests_seen = Counter()
+    failing = set()
+
+    def do_GET(self):
+        self.requests_seen[urlparse(self.path).path] += 1
+        if self.path in self.failing:
+            self.send_error(503)
+            return
+        super().do_GET()
+
+    def translate_path(self, path):
+        url = urlparse(path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/":
+            return os.path.join(SITE, "main.html")
+        if url.path == "/articles/categories":
+            return os.path.join(SITE, "categories", f"{query.get('id')}-{query.get('page', '1')}.html")
+        if url.path == "/articles/detail":
+            return os.path.join(SITE, "detail", f"{query.get('id')}.html")
+        if url.path.startswith("/uploads/guides/"):
+            return os.path.join(HERE, "pdfs", os.path.basename(unquote(url.path)))
+        return os.path.join(SITE, "missing")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def check(condition, message):
+    if not condition:
+        sys.exit(f"FAILED: {message}")
+    print(f"ok: {message}")
+
+
+def scraper_for(base_url, work_dir, name):
+    return ArticleScraper(base_url=base_url, download_dir=os.path.join(work_dir, name),
+                          requests_per_second=100, burst=10, workers=4,
+                          cache_dir=os.path.join(work_dir, "pdf_cache"),
+                          frontier_path=os.path.join(work_dir, "crawl_frontier.json"),
+                          transport=Transport(pool_size=8, max_retries=0))
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    requests_seen = SiteHandler.requests_seen
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            SiteHandler.failing = {FAILING_PAGE}
+            scraper = scraper_for(base_url, work_dir, "downloaded_pdfs")
+            scraper.crawl_categories_concurrent(CATEGORY_IDS)
+            check(set(scraper.frontier.known) == ARTICLE_IDS - {"46"}, "every article of the pages served discovered")
+            check(requests_seen["/articles/categories"] == 5, "every listing page fetched once")
+            check(requests_seen["/articles/detail"] == len(ARTICLE_IDS) - 1, "every article page fetched once")
+            check(len(scraper.changed) == PDF_ARTICLES - 1, f"{PDF_ARTICLES - 1} PDFs downloaded")
+            check(scraper.frontier.failed == {"1": [base_url + FAILING_PAGE]}, "failed listing page recorded")
+
+            SiteHandler.failing = set()
+            requests_seen.clear()
+            scraper = scraper_for(base_url, work_dir, "downloaded_pdfs")
+            scraper.crawl_categories_concurrent(CATEGORY_IDS)
+            check(set(scraper.frontier.known) == ARTICLE_IDS, "article of the failed page discovered on retry")
+            check(requests_seen["/articles/categories"] == 4,
+                  "failed page retried, other categories stop at their first page")
+            check(len(scraper.changed) == 1, "only the new PDF downloaded")
+            check(scraper.frontier.done == ARTICLE_IDS, "every article marked done")
+            check(not scraper.frontier.failed, "no failed listing page left")
+
+            requests_seen.clear()
+            scraper = scraper_for(base_url, work_dir, "downloaded_pdfs")
+            scraper.crawl_categories_concurrent(CATEGORY_IDS, revisit=True)
+            check(requests_seen["/articles/categories"] == len(CATEGORY_IDS),
+                  "incremental discovery stops at the first page of each category")
+            check(not scraper.changed, "revisited PDFs unchanged")
+
+            requests_seen.clear()
+            scraper = scraper_for(base_url, work_dir, "downloaded_pdfs")
+            scraper.crawl_categories_concurrent(CATEGORY_IDS, full_discovery=True)
+            check(requests_seen["/articles/categories"] == 5, "full discovery walks every listing page")
+
+            requests_seen.clear()
+            scraper = scraper_for(base_url, work_dir, "main_page_pdfs")
+            with open(os.path.join(SITE, "main.html"), encoding="utf-8") as f:
+                scraper.scrape_articles_concurrent(f.read())
+            check(requests_seen["/articles/detail"] == 4, "main page articles fetched once each")
+            check(len(os.listdir(scraper.download_dir)) == 3, "main page PDFs in place")
+    finally:
+        server.shutdown()
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
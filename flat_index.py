@@ -0,0 +1,202 @@
+import os
+import json
+import mmap
+import shutil
+import numpy as np
+from quantization import train_pq, pq_encode, pq_scores, int8_encode, int8_scores
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+
+def flat_index_path(persist_directory):
+    """The flat index lives next to the Chroma directory it is exported from"""
+    return os.path.normpath(persist_directory) + ".flat"
+
+
+def write_flat_index(vectorstore, directory, dtype="float16", page_size=1000, quantization="none",
+                     pq_subspaces=96):
+    """Export a Chroma store to the flat read-only format
+
+    embeddings.npy  L2-normalized vectors, one row per chunk
+    ids.npy         chunk IDs, same order
+    records.bin     UTF-8 JSON {"text", "metadata"} records back to back
+    offsets.npy     start of each record in records.bin, plus the end
+
+    With quantization "pq" (codes.npy, codebooks.npy) or "int8" (codes.npy,
+    scales.npy), compressed codes are written as well and searched instead.
+    """
+    if quantization not in ("none", "pq", "int8"):
+        raise ValueError(f"Unknown quantization: {quantization}")
+    count = vectorstore._collection.count()
+    tmp_dir = directory + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    offsets = [0]
+    ids = []
+    vectors = None
+    with open(os.path.join(tmp_dir, "records.bin"), "wb") as records:
+        for offset in range(0, count, page_size):
+            page = vectorstore.get(include=["embeddings", "documents", "metadatas"],
+                                   limit=page_size, offset=offset)
+            block = np.asarray(page["embeddings"], dtype=np.float32)
+            if vectors is None:
+                vectors = np.lib.format.open_memmap(os.path.join(tmp_dir, "embeddings.npy"), mode="w+",
+                                                    dtype=dtype, shape=(count, block.shape[1]))
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            vectors[offset:offset + len(block)] = block / np.clip(norms, 1e-12, None)
+            for chunk_id, text, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+                record = json.dumps({"text": text, "metadata": metadata or {}}, ensure_ascii=False).encode("utf-8")
+                records.write(record)
+                offsets.append(offsets[-1] + len(record))
+                ids.append(chunk_id)
+    if vectors is None:
+        np.save(os.path.join(tmp_dir, "embeddings.npy"), np.zeros((0, 0), dtype=dtype))
+    else:
+        vectors.flush()
+        if quantization == "pq":
+            codebooks = train_pq(vectors, pq_subspaces)
+            np.save(os.path.join(tmp_dir, "codebooks.npy"), codebooks)
+            np.save(os.path.join(tmp_dir, "codes.npy"), pq_encode(vectors, codebooks))
+        elif quantization == "int8":
+            codes, scales = int8_encode(vectors)
+            np.save(os.path.join(tmp_dir, "codes.npy"), codes)
+            np.save(os.path.join(tmp_dir, "scales.npy"), scales)
+        del vectors
+    np.save(os.path.join(tmp_dir, "offsets.npy"), np.asarray(offsets, dtype=np.int64))
+    np.save(os.path.join(tmp_dir, "ids.npy"), np.asarray(ids, dtype=str))
+
+    # Swap the finished index in; readers of the old one keep their mappings
+    old_dir = directory + ".old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(directory):
+        os.rename(directory, old_dir)
+    os.rename(tmp_dir, directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return count
+
+
+class FlatVectorStore(VectorStore):
+    """Read-only vector store over memory-mapped flat index files
+
+    Nothing is read up front: vectors and records are paged in by the OS
+    on demand and shared by every process mapping the same files. Search is
+    an exact brute-force dot product over the normalized vectors.
+
+    If the index was written with quantization, only the compressed codes
+    are loaded in memory. They are scanned with asymmetric distances (float
+    query, quantized vectors) and the best rescore_k candidates are
+    re-scored exactly from the full vectors on disk.
+    """
+
+    def __init__(self, directory, embedding_function, block_size=16384, rescore_k=50):
+        self.directory = directory
+        self.embedding_function = embedding_function
+        self.block_size = block_size
+        self.rescore_k = rescore_k
+        self.vectors = np.load(os.path.join(directory, "embeddings.npy"), mmap_mode="r")
+        self.codes = self.codebooks = self.scales = None
+        if os.path.exists(os.path.join(directory, "codes.npy")):
+            self.codes = np.load(os.path.join(directory, "codes.npy"))
+            if os.path.exists(os.path.join(directory, "codebooks.npy")):
+                self.codebooks = np.load(os.path.join(directory, "codebooks.npy"))
+            else:
+                self.scales = np.load(os.path.join(directory, "scales.npy"))
+        self.offsets = np.load(os.path.join(directory, "offsets.npy"), mmap_mode="r")
+        self.ids = np.load(os.path.join(directory, "ids.npy"), mmap_mode="r")
+        self._records_file = open(os.path.join(directory, "records.bin"), "rb")
+        size = os.fstat(self._records_file.fileno()).st_size
+        self.records = mmap.mmap(self._records_file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._rows = None
+
+    @property
+    def embeddings(self):
+        return self.embedding_function
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, **kwargs):
+        raise NotImplementedError("FlatVectorStore is read-only, it is written by init_db")
+
+    def _document(self, row):
+        record = json.loads(self.records[int(self.offsets[row]):int(self.offsets[row + 1])])
+        return Document(page_content=record["text"], metadata=record["metadata"])
+
+    @property
+    def quantization(self):
+        if self.codes is None:
+            return "none"
+        return "pq" if self.codebooks is not None else "int8"
+
+    def memory_bytes(self):
+        """Size of the per-vector data a search scans: the codes (and int8 scales) when quantized, else the vectors"""
+        if self.codes is None:
+            return self.vectors.nbytes
+        return self.codes.nbytes + (self.scales.nbytes if self.codebooks is None else 0)
+
+    def codebook_bytes(self):
+        """Size of the PQ codebooks, a fixed cost whatever the number of vectors"""
+        return self.codebooks.nbytes if self.codebooks is not None else 0
+
+    def scores(self, vector):
+        """Cosine similarity of vector with every stored chunk"""
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        if self.vectors.dtype == np.float32:
+            return self.vectors @ query
+        # float16 has no BLAS path: upcast block by block
+        out = np.empty(len(self.vectors), dtype=np.float32)
+        for start in range(0, len(self.vectors), self.block_size):
+            block = np.asarray(self.vectors[start:start + self.block_size], dtype=np.float32)
+            out[start:start + len(block)] = block @ query
+        return out
+
+    def approximate_scores(self, vector):
+        """Similarity of vector with every stored chunk, computed from the quantized codes"""
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        if self.codebooks is not None:
+            return pq_scores(query, self.codes, self.codebooks)
+        return int8_scores(query, self.codes, self.scales)
+
+    def _best(self, scores, k):
+        k = min(k, len(scores))
+        if k == 0:
+            return np.empty(0, dtype=np.int64)
+        rows = np.argpartition(-scores, k - 1)[:k]
+        return rows[np.argsort(-scores[rows])]
+
+    def top_k(self, vector, k):
+        """(row, score) of the k most similar chunks, best first"""
+        if self.codes is None:
+            scores = self.scores(vector)
+            return [(int(row), float(scores[row])) for row in self._best(scores, k)]
+        candidates = np.sort(self._best(self.approximate_scores(vector), max(k, self.rescore_k)))
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        # Only the candidate rows of the full vectors are read from disk
+        exact = np.asarray(self.vectors[candidates], dtype=np.float32) @ query
+        return [(int(candidates[i]), float(exact[i])) for i in self._best(exact, k)]
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4, **kwargs):
+        return [(self._document(row), score) for row, score in self.top_k(embedding, k)]
+
+    def similarity_search_by_vector(self, embedding, k=4, **kwargs):
+        return [document for document, _ in self.similarity_search_with_score_by_vector(embedding, k)]
+
+    def similarity_search(self, query, k=4, **kwargs):
+        return self.similarity_search_by_vector(self.embedding_function.embed_query(query), k)
+
+    def _similarity_search_with_relevance_scores(self, query, k=4, **kwargs):
+        vector = self.embedding_function.embed_query(query)
+        return self.similarity_search_with_score_by_vector(vector, k)
+
+    def get(self, ids=None, include=None, **kwargs):
+        """Chroma-style lookup of stored chunks by ID"""
+        if self._rows is None:
+            self._rows = {str(chunk_id): row for row, chunk_id in enumerate(self.ids)}
+        rows = [self._rows[chunk_id] for chunk_id in (ids or []) if chunk_id in self._rows]
+        documents = [self._document(row) for row in rows]
+        return {
+            "ids": [str(self.ids[row]) for row in rows],
+            "documents": [document.page_content for document in documents],
+            "metadatas": [document.metadata for document in documents],
+        }
@@ -0,0 +1,143 @@
+import logging
+import threading
+import queue
+from manifest import file_hash, chunk_id
+from pdf_parsing import iter_parsed_pdfs
+
+_END = object()
+
+
+class FileChunks:
+    """The chunks of one PDF version
+
+    duplicates holds (kept chunk ID, dropped chunk) pairs for chunks left
+    out as near-duplicates of a chunk stored before them.
+    """
+
+    def __init__(self, path, content_hash, chunks, ids, pages=0):
+        self.path = path
+        self.content_hash = content_hash
+        self.chunks = chunks
+        self.ids = ids
+        self.pages = pages
+        self.duplicates = []
+
+
+class Batch:
+    """Embedded chunks ready to upsert, plus the files whose last chunk is in it"""
+
+    def __init__(self):
+        self.ids = []
+        self.texts = []
+        self.metadatas = []
+        self.vectors = []
+        self.completed = []
+
+
+def buffered(iterable, maxsize):
+    """Run iterable in a background thread, handing items over a bounded queue"""
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                while not stop.is_set():
+                    try:
+                        items.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if stop.is_set():
+                    return
+            items.put(_END)
+        except BaseException as e:
+            items.put(e)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def split_files(parsed, text_splitter):
+    """Stage 2: split the pages of each parsed PDF into chunks with stable IDs"""
+    for pdf_file, pages, error in parsed:
+        if error:
+            logging.error(f"Error loading file {pdf_file}: {error}")
+            continue
+        content_hash = file_hash(pdf_file)
+        chunks = text_splitter.split_documents(pages)
+        ids = [chunk_id(pdf_file, content_hash, i) for i in range(len(chunks))]
+        for chunk, text_id in zip(chunks, ids):
+            chunk.metadata["chunk_id"] = text_id
+        yield FileChunks(pdf_file, content_hash, chunks, ids, pages=len(pages))
+
+
+def dedup_files(files, index):
+    """Stage 2b: drop chunks that nearly duplicate one stored or kept earlier in the run"""
+    for file_chunks in files:
+        chunks, ids = [], []
+        for chunk, text_id in zip(file_chunks.chunks, file_chunks.ids):
+            signature = index.signature(chunk.page_content)
+            original = index.find(signature)
+            if original is None:
+                index.add(text_id, signature)
+                chunks.append(chunk)
+                ids.append(text_id)
+            else:
+                file_chunks.duplicates.append((original, chunk))
+        file_chunks.chunks, file_chunks.ids = chunks, ids
+        yield file_chunks
+
+
+def embed_batches(files, embeddings, batch_size):
+    """Stage 3: embed chunks in fixed-size batches that may span several files"""
+    batch = Batch()
+    for file_chunks in files:
+        for chunk, text_id in zip(file_chunks.chunks, file_chunks.ids):
+            batch.ids.append(text_id)
+            batch.texts.append(chunk.page_content)
+            batch.metadatas.append(chunk.metadata)
+            if len(batch.ids) >= batch_size:
+                batch.vectors = embeddings.embed_documents(batch.texts)
+                yield batch
+                batch = Batch()
+        batch.completed.append(file_chunks)
+    if batch.ids:
+        batch.vectors = embeddings.embed_documents(batch.texts)
+    if batch.ids or batch.completed:
+        yield batch
+
+
+def ingest_pdfs(pdf_files, vectorstore, embeddings, text_splitter, workers=None,
+                batch_size=256, queue_size=4, dedup=None):
+    """Stream PDFs through parse -> split -> [dedup ->] embed -> upsert
+
+    Stages run concurrently and are connected by bounded queues, so memory
+    stays flat whatever the corpus size. Yields each FileChunks once all of
+    its chunks are stored. With a DedupIndex, near-duplicate chunks are
+    dropped before they are embedded.
+    """
+    parsed = buffered(iter_parsed_pdfs(pdf_files, workers), queue_size)
+    files = buffered(split_files(parsed, text_splitter), queue_size)
+    if dedup is not None:
+        files = buffered(dedup_files(files, dedup), queue_size)
+    batches = buffered(embed_batches(files, embeddings, batch_size), queue_size)
+    for batch in batches:
+        if batch.ids:
+            vectorstore._collection.upsert(
+                ids=batch.ids,
+                embeddings=batch.vectors,
+                documents=batch.texts,
+                metadatas=batch.metadatas,
+            )
+        yield from batch.completed
@@ -1,11 +1,19 @@
 import os
+import shutil
 import logging
 from langchain_groq import ChatGroq
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_chroma import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
-from pypdf.errors import PdfReadError, PdfStreamError
+from manifest import Manifest, manifest_path
+from ingest import ingest_pdfs
+from pdf_parsing import list_pdfs
+from embedding_engine import build_embeddings
+from chunking import build_text_splitter, splitter_signature, truncated_chunks, LEGACY_SPLITTER_SIGNATURE
+from lexical_index import build_lexical_index, lexical_index_path
+from flat_index import write_flat_index, flat_index_path
+from pdf_cache import read_pending_changes, clear_pending_changes
+from dedup import DedupIndex, dedup_index_path, add_back_references, drop_back_references
+from store_versions import live_directory, staging_path, publish
+import config
 
 # Load env vars
 api_grok = "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"
@@ -23,47 +31,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 # Initialize language model, embeddings and text splitter
 llm = ChatGroq(model_name="mixtral-8x7b-32768", temperature=0.7, max_tokens=2048)
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-mpnet-base-v2",
-                                   model_kwargs={'device': 'cpu'})
-text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, length_function=len)
-
-
-def load_pdfs(pdf_path, is_directory=False):
-    all_documents = []
-    if is_directory:
-        loader = DirectoryLoader(
-            pdf_path,
-            glob="**/*.pdf",
-            loader_cls=PyPDFLoader
-        )
-        for document in loader.lazy_load():
-            try:
-                logging.info(f"Loading file: {document.metadata.get('source', 'unknown')}")
-                all_documents.append(document)
-            except (PdfReadError, PdfStreamError) as e:
-                logging.error(f"Error loading file {document.metadata.get('source', 'unknown')}: {e}")
-    else:
-        loader = PyPDFLoader(pdf_path)
-        try:
-            logging.info(f"Loading file: {pdf_path}")
-            all_documents = loader.load()
-        except (PdfReadError, PdfStreamError) as e:
-            logging.error(f"Error loading file {pdf_path}: {e}")
-    if not all_documents:
-        logging.warning("No documents were loaded.")
-    return all_documents
-
-
-def create_vectorstore(documents, persist_directory, _embeddings):  # Changed embeddings to _embeddings
-    logging.info("Creating vector store")
-    texts = text_splitter.split_documents(documents)
-    vectorstore = Chroma.from_documents(
-        documents=texts,
-        embedding=_embeddings,  # Changed embeddings to _embeddings
-        persist_directory=persist_directory
-    )
-    logging.info("Vector store created")
-    return vectorstore
+embeddings = build_embeddings()
+text_splitter = build_text_splitter()
 
 
 def check_document_count(persist_directory):
@@ -78,21 +47,195 @@ def check_document_count(persist_directory):
         logging.warning("Vectorstore does not exist.")
     
 
+def prepare_staging(source_directory, staging_directory):
+    """Copy the live store, if there is one, and its sidecars to the staging location"""
+    if source_directory is None:
+        return
+    for sidecar in (manifest_path, dedup_index_path):
+        if os.path.exists(sidecar(source_directory)):
+            shutil.copy2(sidecar(source_directory), sidecar(staging_directory))
+    # Copied under a temporary name so that a staging directory is always complete
+    tmp_directory = staging_directory + ".tmp"
+    shutil.rmtree(tmp_directory, ignore_errors=True)
+    shutil.copytree(source_directory, tmp_directory)
+    os.rename(tmp_directory, staging_directory)
+
+
+def swap_in(staging_directory, persist_directory, _embeddings):
+    """Build the derived indexes of the finished staging copy and make it the live version"""
+    update_lexical_index(staging_directory, _embeddings)
+    if config.VECTOR_INDEX == "flat":
+        update_flat_index(staging_directory, _embeddings)
+    directory = publish(staging_directory, persist_directory)
+    logging.info(f"Swapped the updated vectorstore into: {directory}")
+
+
+def delete_unrecorded(vectorstore, recorded, batch_size=5000):
+    """Delete the stored chunks whose IDs the journal does not list"""
+    orphans = [chunk_id for chunk_id in vectorstore.get(include=[])["ids"] if chunk_id not in recorded]
+    for start in range(0, len(orphans), batch_size):
+        vectorstore.delete(ids=orphans[start:start + batch_size])
+    if orphans:
+        logging.info(f"Deleted {len(orphans)} chunks left over by the interrupted run")
+
+
+def update_vectorstore(pdf_path, persist_directory, _embeddings, workers=None, candidates=None):
+    """Embed new or changed PDFs and drop the chunks of removed ones; True if the store changed
+
+    Work happens in a staging copy that becomes a new version of the store,
+    indexes included, only once complete, so the app never opens a partial
+    store. The staging manifest is saved every CHECKPOINT_FILES files and
+    serves as the journal: an interrupted run is resumed by the next one,
+    which skips the PDFs recorded there.
+
+    candidates, the scraper's list of downloaded PDFs that changed, are
+    hashed even if their size and mtime match; the other PDFs are stat-checked.
+    """
+    staging_directory = staging_path(persist_directory)
+    live = live_directory(persist_directory)
+    resuming = os.path.exists(staging_directory)
+    build_directory = staging_directory if resuming else live
+    if resuming:
+        logging.info(f"Resuming the interrupted update in: {staging_directory}")
+    store_exists = build_directory is not None
+    manifest = Manifest(manifest_path(build_directory or staging_directory))
+    if not store_exists:
+        manifest.files = {}
+    pdf_files = list_pdfs(pdf_path)
+    changed, removed = manifest.diff(pdf_files, candidates)
+    signature = splitter_signature(text_splitter)
+    if config.DEDUP:
+        signature += f"+minhash:{config.DEDUP_THRESHOLD}"
+    if manifest.files and (manifest.splitter or LEGACY_SPLITTER_SIGNATURE) != signature:
+        logging.info(f"Chunking settings changed to {signature}, re-splitting every PDF")
+        changed = pdf_files
+    if store_exists and not changed and not removed:
+        if resuming:
+            # Interrupted after the last file, before the swap
+            swap_in(staging_directory, persist_directory, _embeddings)
+            return True
+        logging.info(f"Vectorstore is up to date in: {live}")
+        return False
+    logging.info(f"{len(changed)} new or changed PDFs, {len(removed)} removed PDFs")
+
+    if not resuming:
+        prepare_staging(live, staging_directory)
+        manifest.path = manifest_path(staging_directory)
+    vectorstore = Chroma(persist_directory=staging_directory, embedding_function=_embeddings)
+    if store_exists and not manifest.files:
+        # Built before manifests existed: chunk IDs are unknown, start over
+        logging.info("Vectorstore has no manifest, rebuilding it")
+        vectorstore.reset_collection()
+    # Chunks written after the last checkpoint of an interrupted run are not in the journal
+    recorded = {chunk for path in manifest.files for chunk in manifest.chunk_ids(path)}
+    if resuming:
+        delete_unrecorded(vectorstore, recorded)
+
+    dedup = None
+    if config.DEDUP:
+        dedup = DedupIndex.load(dedup_index_path(staging_directory), config.DEDUP_THRESHOLD) if manifest.files else None
+        if dedup is None:
+            dedup = (DedupIndex.build(vectorstore, config.DEDUP_THRESHOLD) if manifest.files
+                     else DedupIndex(threshold=config.DEDUP_THRESHOLD))
+        dedup.remove(set(dedup.ids) - recorded)
+        # Files whose duplicates were dropped in favour of chunks that are about to go
+        dependents = [path for path in manifest.dependents(removed + changed) if path in set(pdf_files)]
+        if dependents:
+            logging.info(f"Re-embedding {len(dependents)} PDFs that shared chunks with changed PDFs")
+            changed = changed + dependents
+
+    for pdf_file in removed + changed:
+        stale_ids = manifest.chunk_ids(pdf_file)
+        if stale_ids:
+            vectorstore.delete(ids=stale_ids)
+        if dedup is not None:
+            dedup.remove(stale_ids)
+            drop_back_references(vectorstore, manifest.dedup_refs(pdf_file), pdf_file)
+        manifest.remove(pdf_file)
+    # From here on the journal lists exactly the files whose chunks are in the store
+    references = {}
+
+    def checkpoint():
+        if dedup is not None:
+            add_back_references(vectorstore, references)
+            references.clear()
+            dedup.save(dedup_index_path(staging_directory))
+        manifest.splitter = signature
+        manifest.save()
+
+    checkpoint()
+    # Files that fail to parse stay out of the manifest so the next run retries them
+    total = truncated = dropped = done = 0
+    for file_chunks in ingest_pdfs(changed, vectorstore, _embeddings, text_splitter, workers, dedup=dedup):
+        kept_ids = [kept_id for kept_id, _ in file_chunks.duplicates]
+        manifest.record(file_chunks.path, file_chunks.content_hash, file_chunks.ids, dedup_refs=kept_ids)
+        for kept_id, duplicate in file_chunks.duplicates:
+            references.setdefault(kept_id, []).append(
+                {"source": duplicate.metadata.get("source"), "page": duplicate.metadata.get("page")})
+        dropped += len(file_chunks.duplicates)
+        # The embedding model ignores everything past its token limit
+        file_truncated = len(truncated_chunks(file_chunks.chunks))
+        total += len(file_chunks.ids)
+        truncated += file_truncated
+        note = f", {file_truncated} truncated" if file_truncated else ""
+        note += f", {len(file_chunks.duplicates)} duplicates dropped" if file_chunks.duplicates else ""
+        logging.info(f"Embedded {len(file_chunks.ids)} chunks from {file_chunks.path}{note}")
+        done += 1
+        if done % config.CHECKPOINT_FILES == 0:
+            checkpoint()
+    if truncated:
+        logging.warning(f"{truncated} of {total} chunks exceed {config.EMBEDDING_MAX_TOKENS} tokens "
+                        f"and were truncated when embedded")
+    if dedup is not None:
+        logging.info(f"Dropped {dropped} near-duplicate chunks")
+    checkpoint()
+    del vectorstore
+    swap_in(staging_directory, persist_directory, _embeddings)
+    return True
+
+
+def is_stale(path, persist_directory):
+    """A derived index is stale when missing or older than the store's manifest"""
+    if not os.path.exists(path):
+        return True
+    manifest_file = manifest_path(persist_directory)
+    return os.path.exists(manifest_file) and os.stat(path).st_mtime < os.stat(manifest_file).st_mtime
+
+
+def update_lexical_index(persist_directory, _embeddings):
+    """Rebuild the BM25 index used by hybrid retrieval from the stored chunks"""
+    index_path = lexical_index_path(persist_directory)
+    vectorstore = Chroma(persist_directory=persist_directory, embedding_function=_embeddings)
+    index = build_lexical_index(vectorstore, index_path)
+    logging.info(f"Lexical index of {len(index.ids)} chunks saved in: {index_path}")
+
+
+def update_flat_index(persist_directory, _embeddings):
+    """Export the store to the memory-mapped flat index read by the app"""
+    index_path = flat_index_path(persist_directory)
+    vectorstore = Chroma(persist_directory=persist_directory, embedding_function=_embeddings)
+    count = write_flat_index(vectorstore, index_path, dtype=config.FLAT_INDEX_DTYPE,
+                             quantization=config.FLAT_INDEX_QUANTIZATION, pq_subspaces=config.PQ_SUBSPACES)
+    logging.info(f"Flat index of {count} chunks saved in: {index_path}")
+
+
 def main():
     pdf_path = "/home/updog/ragllm/downloaded_pdfs" # path to the folder where PDFs are stored
     persist_directory = os.path.join("chroma_db",  os.path.basename(pdf_path)) # Changed folder path
     logging.info("Starting initialization of the database...")
-    documents = load_pdfs(pdf_path, is_directory=True)
-    
-    if documents:
-        if not os.path.exists(persist_directory):
-            logging.info("Creating vectorstore...")
-            vectorstore = create_vectorstore(documents, persist_directory, embeddings)  # Changed embeddings to embeddings
-            logging.info(f"Vectorstore created and saved in: {persist_directory}")
-        else:
-            logging.info(f"Vectorstore already exists in: {persist_directory}")
+    if list_pdfs(pdf_path):
+        # The scraper lists the PDFs it added or changed since the last run
+        candidates = read_pending_changes(pdf_path)
+        update_vectorstore(pdf_path, persist_directory, embeddings, candidates=candidates)
+        clear_pending_changes(pdf_path)
+        # New versions come with their indexes; this catches stores older than that or a switch to the flat index
+        live = live_directory(persist_directory)
+        if is_stale(lexical_index_path(live), live):
+            update_lexical_index(live, embeddings)
+        if config.VECTOR_INDEX == "flat" and is_stale(flat_index_path(live), live):
+            update_flat_index(live, embeddings)
         # Check the document count
-        check_document_count(persist_directory)
+        check_document_count(live)
     else:
         logging.warning("No documents were loaded, therefore no vectorstore will be created")
     logging.info("Finished initialization of the database.")
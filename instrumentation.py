@@ -0,0 +1,229 @@
+import time
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.embeddings import Embeddings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_local = threading.local()
+
+
+class Histogram:
+    """Cumulative Prometheus buckets plus a rolling window for percentiles"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS, window=1000):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def percentile(self, q):
+        if not self.recent:
+            return None
+        values = sorted(self.recent)
+        return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+class Metrics:
+    """Per-stage latency histograms and token counters of the RAG chain"""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.latency = {}
+        self.tokens = {}
+        self.lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            if stage not in self.latency:
+                self.latency[stage] = Histogram(window=self.window)
+            self.latency[stage].observe(seconds)
+
+    def add_tokens(self, stage, kind, count):
+        with self.lock:
+            self.tokens[(stage, kind)] = self.tokens.get((stage, kind), 0) + count
+
+    def snapshot(self):
+        """Rolling p50/p95/p99 in milliseconds per stage"""
+        with self.lock:
+            return {
+                stage: {
+                    "count": histogram.count,
+                    **{f"p{q}": round(histogram.percentile(q) * 1000, 1) for q in (50, 95, 99)},
+                }
+                for stage, histogram in self.latency.items() if histogram.count
+            }
+
+    def render_prometheus(self):
+        """Prometheus text exposition format"""
+        lines = [
+            "# HELP rag_stage_latency_seconds Latency of each RAG chain stage.",
+            "# TYPE rag_stage_latency_seconds histogram",
+        ]
+        with self.lock:
+            for stage, histogram in sorted(self.latency.items()):
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'rag_stage_latency_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'rag_stage_latency_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'rag_stage_latency_seconds_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'rag_stage_latency_seconds_count{{stage="{stage}"}} {histogram.count}')
+            lines.append("# HELP rag_tokens_total Tokens sent to and generated by the LLM.")
+            lines.append("# TYPE rag_tokens_total counter")
+            for (stage, kind), count in sorted(self.tokens.items()):
+                lines.append(f'rag_tokens_total{{stage="{stage}",kind="{kind}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(metrics, port, host="127.0.0.1"):
+    """Serve metrics.render_prometheus() on /metrics from a daemon thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class TimedEmbeddings(Embeddings):
+    """Embeddings wrapper recording the "embed" stage
+
+    The time is also accumulated per thread so StageTimer can subtract it
+    from the retriever span and report pure vector search time.
+    """
+
+    def __init__(self, embeddings, metrics):
+        self.embeddings = embeddings
+        self.metrics = metrics
+
+    def _timed(self, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.observe("embed", elapsed)
+            _local.embed_seconds = getattr(_local, "embed_seconds", 0.0) + elapsed
+
+    def embed_documents(self, texts):
+        return self._timed(self.embeddings.embed_documents, texts)
+
+    def embed_query(self, text):
+        return self._timed(self.embeddings.embed_query, text)
+
+
+class StageTimer(BaseCallbackHandler):
+    """Callback handler timing one chain call: condense, vector search, generate
+
+    LLM calls made before retrieval are the question condensation, the ones
+    after it generate the answer. Create one handler per call.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.starts = {}
+        self.retrieved = False
+        self.nested_seconds = {}
+        self.turn_tokens = {}
+
+    def _start(self, run_id, stage):
+        self.starts[run_id] = (stage, time.perf_counter())
+
+    def _end(self, run_id):
+        stage, start = self.starts.pop(run_id, (None, None))[:2]
+        if stage is not None:
+            self.metrics.observe(stage, time.perf_counter() - start)
+        return stage
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, **kwargs):
+        if parent_run_id is None:
+            self._start(run_id, "chain")
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self.starts.pop(run_id, None)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, "generate" if self.retrieved else "condense")
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, "generate" if self.retrieved else "condense")
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        stage = self._end(run_id)
+        if stage is None:
+            return
+        prompt_tokens, completion_tokens = _token_usage(response)
+        for kind, count in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+            if count:
+                self.metrics.add_tokens(stage, kind, count)
+                self.turn_tokens[(stage, kind)] = self.turn_tokens.get((stage, kind), 0) + count
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self.starts.pop(run_id, None)
+
+    def on_retriever_start(self, serialized, query, *, run_id, parent_run_id=None, **kwargs):
+        embed_before = getattr(_local, "embed_seconds", 0.0)
+        self.starts[run_id] = ("retrieve", time.perf_counter(), embed_before, parent_run_id)
+
+    def on_retriever_end(self, documents, *, run_id, **kwargs):
+        stage, start, embed_before, parent_run_id = self.starts.pop(run_id, (None, None, None, None))
+        if stage is None:
+            return
+        elapsed = time.perf_counter() - start
+        nested = self.nested_seconds.pop(run_id, None)
+        if nested is not None:
+            # A retriever wrapping another one: its own time is the reranking
+            self.metrics.observe("rerank", max(0.0, elapsed - nested))
+        else:
+            embed_seconds = getattr(_local, "embed_seconds", 0.0) - embed_before
+            self.metrics.observe("vector_search", max(0.0, elapsed - embed_seconds))
+        if parent_run_id in self.starts and self.starts[parent_run_id][0] == "retrieve":
+            self.nested_seconds[parent_run_id] = self.nested_seconds.get(parent_run_id, 0.0) + elapsed
+        else:
+            self.retrieved = True
+
+    def on_retriever_error(self, error, *, run_id, **kwargs):
+        self.starts.pop(run_id, None)
+        self.nested_seconds.pop(run_id, None)
+
+
+def _token_usage(response):
+    """(prompt, completion) token counts of an LLMResult, if the provider reports them"""
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not (prompt_tokens or completion_tokens):
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
@@ -0,0 +1,205 @@
+import os
+import re
+import json
+import math
+import threading
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+_ARABIC_MARKS = re.compile(r"[\u064B-\u0652\u0670\u0640]")
+_ARABIC_LETTERS = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي"})
+_TOKEN = re.compile(r"\w+")
+_ARABIC_WORD = re.compile(r"^[\u0621-\u064A]+$")
+
+# Normalized forms (see normalize) of frequent Arabic and French function words
+STOPWORDS = {
+    "في", "من", "علي", "الي", "عن", "مع", "ما", "ماذا", "هل", "كيف", "متي", "اين", "لماذا", "هو", "هي",
+    "هم", "هذا", "هذه", "ذلك", "تلك", "التي", "الذي", "الذين", "او", "ام", "ثم", "كل", "بعض", "بين",
+    "عند", "لا", "لم", "لن", "قد", "ان", "كان", "كانت", "يكون", "تكون", "به", "بها", "له", "لها",
+    "le", "la", "les", "de", "des", "du", "un", "une", "et", "ou", "en", "au", "aux", "pour", "par",
+    "sur", "dans", "avec", "est", "sont", "que", "qui", "quoi", "quel", "quelle", "quels", "quelles",
+    "comment", "ce", "ces", "cette", "il", "elle", "ils", "elles", "on", "se", "sa", "son", "ses", "pas",
+}
+_ARABIC_PREFIXES = ("وال", "بال", "كال", "فال", "لل", "ال")
+_ARABIC_SUFFIXES = ("ها", "ان", "ات", "ون", "ين", "يه", "يا", "ه", "ي")
+
+
+def normalize(text):
+    """Casefold, drop Arabic diacritics and tatweel, unify alef/ya/ta marbuta, strip Latin accents"""
+    text = _ARABIC_MARKS.sub("", unicodedata.normalize("NFKC", text)).translate(_ARABIC_LETTERS)
+    text = "".join(c for c in unicodedata.normalize("NFD", text.casefold()) if not unicodedata.combining(c))
+    return unicodedata.normalize("NFC", text)
+
+
+def light_stem(word):
+    """Light stemming: Arabic article/conjunction prefixes and common suffixes, French plurals"""
+    if _ARABIC_WORD.match(word):
+        for prefix in _ARABIC_PREFIXES:
+            if word.startswith(prefix) and len(word) - len(prefix) >= 2:
+                word = word[len(prefix):]
+                break
+        else:
+            if word[0] == "و" and len(word) > 3:
+                word = word[1:]
+        for suffix in _ARABIC_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                return word[:-len(suffix)]
+        return word
+    if len(word) > 3 and word[-1] in "sx":
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Index terms of a text"""
+    terms = []
+    for word in _TOKEN.findall(normalize(text)):
+        if word in STOPWORDS or word.isdigit() or len(word) < 2:
+            continue
+        terms.append(light_stem(word))
+    return terms
+
+
+def lexical_index_path(persist_directory):
+    """The inverted index lives next to the Chroma directory it mirrors"""
+    return os.path.normpath(persist_directory) + ".lexical.json"
+
+
+class LexicalIndex:
+    """BM25 inverted index over the chunks of the vector store"""
+
+    def __init__(self, ids, lengths, postings, k1=1.5, b=0.75):
+        self.ids = ids
+        self.lengths = lengths
+        self.postings = postings
+        self.k1 = k1
+        self.b = b
+        self.avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    @classmethod
+    def build(cls, chunks):
+        """Index (chunk_id, text) pairs"""
+        ids, lengths, postings = [], [], {}
+        for doc, (chunk_id, text) in enumerate(chunks):
+            terms = tokenize(text)
+            ids.append(chunk_id)
+            lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                postings.setdefault(term, []).append([doc, count])
+        return cls(ids, lengths, postings)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["ids"], data["lengths"], data["postings"])
+
+    def save(self, path):
+        """Write the index atomically"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"ids": self.ids, "lengths": self.lengths, "postings": self.postings},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def search(self, query, k):
+        """Top-k (chunk_id, BM25 score) for query"""
+        scores = Counter()
+        total = len(self.ids)
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, count in postings:
+                norm = 1 - self.b + self.b * self.lengths[doc] / self.avg_length
+                scores[doc] += idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+        return [(self.ids[doc], score) for doc, score in scores.most_common(k)]
+
+
+def build_lexical_index(vectorstore, path, page_size=1000):
+    """Index every chunk stored in a Chroma vector store"""
+    chunks = []
+    offset = 0
+    while True:
+        page = vectorstore.get(include=["documents"], limit=page_size, offset=offset)
+        chunks.extend(zip(page["ids"], page["documents"]))
+        if len(page["ids"]) < page_size:
+            break
+        offset += page_size
+    index = LexicalIndex.build(chunks)
+    index.save(path)
+    return index
+
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def load_lexical_index(path):
+    """Load an index once per process; reloaded when the file changes, None if there is none"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+    with _loaded_lock:
+        cached = _loaded.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, LexicalIndex.load(path))
+            _loaded[path] = cached
+        return cached[1]
+
+
+def _chunk_id(document):
+    return document.metadata.get("chunk_id") or getattr(document, "id", None) or document.page_content
+
+
+# Lexical search runs here while the dense search runs in the caller's thread
+_lexical_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lexical-search")
+
+
+class HybridRetriever(BaseRetriever):
+    """Dense + BM25 retrieval fused with reciprocal-rank fusion
+
+    The inverted index is loaded on first use. Without an index file it
+    behaves like the plain dense retriever.
+    """
+
+    vectorstore: Any
+    index_path: str
+    k: int = 3
+    fetch_k: int = 20
+    rrf_k: int = 60
+    query_prefix: str = ""
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        if self.query_prefix and query.startswith(self.query_prefix):
+            lexical_query = query[len(self.query_prefix):]
+        else:
+            lexical_query = query
+        index = load_lexical_index(self.index_path)
+        lexical = _lexical_pool.submit(index.search, lexical_query, self.fetch_k) if index else None
+        dense = self.vectorstore.similarity_search(query, k=self.fetch_k)
+        if lexical is None:
+            return dense[:self.k]
+
+        scores = Counter()
+        documents = {}
+        for rank, document in enumerate(dense):
+            chunk_id = _chunk_id(document)
+            documents[chunk_id] = document
+            scores[chunk_id] += 1 / (self.rrf_k + rank + 1)
+        for rank, (chunk_id, _) in enumerate(lexical.result()):
+            scores[chunk_id] += 1 / (self.rrf_k + rank + 1)
+        top_ids = [chunk_id for chunk_id, _ in scores.most_common(self.k)]
+
+        missing = [chunk_id for chunk_id in top_ids if chunk_id not in documents]
+        if missing:
+            found = self.vectorstore.get(ids=missing, include=["documents", "metadatas"])
+            for chunk_id, text, metadata in zip(found["ids"], found["documents"], found["metadatas"]):
+                documents[chunk_id] = Document(page_content=text, metadata=metadata or {})
+        return [documents[chunk_id] for chunk_id in top_ids if chunk_id in documents]
@@ -0,0 +1,116 @@
+import os
+import json
+import hashlib
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_id(source, content_hash, index):
+    """Stable ID of the index-th chunk of one version of a PDF"""
+    key = f"{source}\0{content_hash}\0{index}".encode('utf-8')
+    return hashlib.sha256(key).hexdigest()[:32]
+
+
+def manifest_path(persist_directory):
+    """The manifest lives next to the Chroma directory it describes"""
+    return os.path.normpath(persist_directory) + ".manifest.json"
+
+
+class Manifest:
+    """Record of the PDFs embedded in a vector store: size, mtime, content hash and chunk IDs
+
+    splitter is the signature of the chunking settings the chunks were made with.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.splitter = None
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.files = data.get("files", {})
+            self.splitter = data.get("splitter")
+
+    def is_unchanged(self, path, recheck=False):
+        """True if path is recorded with the same content; stat is checked before hashing, unless recheck"""
+        entry = self.files.get(path)
+        if entry is None:
+            return False
+        stat = os.stat(path)
+        if not recheck and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return True
+        if entry["size"] != stat.st_size or entry["hash"] != file_hash(path):
+            return False
+        # Touched but identical: remember the new mtime so it is not hashed again
+        entry["mtime"] = stat.st_mtime
+        return True
+
+    def diff(self, paths, candidates=None):
+        """Split paths into (new or changed, removed) relative to the manifest
+
+        Every recorded path is stat-checked, so files replaced outside the
+        scraper are caught too; candidates, files reported as changed, are
+        hashed even when their size and mtime match the record.
+        """
+        candidates = set(candidates or ())
+        changed = [path for path in paths if not self.is_unchanged(path, recheck=path in candidates)]
+        present = set(paths)
+        removed = [path for path in self.files if path not in present]
+        return changed, removed
+
+    def chunk_ids(self, path):
+        entry = self.files.get(path)
+        return list(entry["chunk_ids"]) if entry else []
+
+    def dedup_refs(self, path):
+        """IDs of the chunks of other files that this file's dropped duplicates point at"""
+        entry = self.files.get(path)
+        return list(entry.get("dedup_refs", [])) if entry else []
+
+    def dependents(self, paths):
+        """Files whose dropped duplicates point, directly or not, at chunks of paths"""
+        paths = set(paths)
+        ids = {chunk for path in paths for chunk in self.chunk_ids(path)}
+        found = set()
+        grew = True
+        while grew:
+            grew = False
+            for path, entry in self.files.items():
+                if path in paths or path in found or not ids.intersection(entry.get("dedup_refs", ())):
+                    continue
+                found.add(path)
+                ids.update(entry["chunk_ids"])
+                grew = True
+        return sorted(found)
+
+    def record(self, path, content_hash, chunk_ids, dedup_refs=()):
+        stat = os.stat(path)
+        self.files[path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": content_hash,
+            "chunk_ids": list(chunk_ids),
+        }
+        if dedup_refs:
+            self.files[path]["dedup_refs"] = sorted(set(dedup_refs))
+
+    def remove(self, path):
+        self.files.pop(path, None)
+
+    def save(self):
+        """Write the manifest atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "splitter": self.splitter, "files": self.files}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
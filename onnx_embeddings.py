@@ -0,0 +1,130 @@
+import os
+import sys
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+def export_onnx(model_name, export_dir, quantize=False):
+    """Export a sentence-transformer's encoder to ONNX once; returns the model path
+
+    With quantize, weights are additionally converted to int8 with dynamic
+    quantization and the quantized model is returned.
+    """
+    fp32_path = os.path.join(export_dir, "model.onnx")
+    if not os.path.exists(fp32_path):
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        os.makedirs(export_dir, exist_ok=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        tokenizer.save_pretrained(export_dir)
+        model = AutoModel.from_pretrained(model_name).eval()
+        sample = tokenizer(["export"], return_tensors="pt")
+        tmp_path = fp32_path + ".tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (sample["input_ids"], sample["attention_mask"]),
+                tmp_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["last_hidden_state"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "last_hidden_state": {0: "batch", 1: "sequence"},
+                },
+                opset_version=17,
+                dynamo=False,
+            )
+        os.replace(tmp_path, fp32_path)
+    if not quantize:
+        return fp32_path
+
+    int8_path = os.path.join(export_dir, "model.int8.onnx")
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        quantize_dynamic(fp32_path, int8_path + ".tmp", weight_type=QuantType.QInt8)
+        os.replace(int8_path + ".tmp", int8_path)
+    return int8_path
+
+
+class OnnxEmbeddings(Embeddings):
+    """Sentence-transformer embeddings computed with ONNX Runtime on CPU
+
+    Reproduces the all-mpnet-base-v2 pipeline: encoder, mean pooling over
+    the attention mask, then L2 normalization.
+    """
+
+    def __init__(self, model_name, export_dir, quantize=False, batch_size=32, max_length=384):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        model_path = export_onnx(model_name, export_dir, quantize)
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.batch_size = batch_size
+        self.max_length = max_length
+
+    def _encode(self, texts):
+        encoded = self.tokenizer(texts, padding=True, truncation=True,
+                                 max_length=self.max_length, return_tensors="np")
+        mask = encoded["attention_mask"].astype(np.int64)
+        hidden = self.session.run(None, {
+            "input_ids": encoded["input_ids"].astype(np.int64),
+            "attention_mask": mask,
+        })[0]
+        weights = mask[:, :, None].astype(np.float32)
+        pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+
+    def embed_documents(self, texts):
+        vectors = []
+        for i in range(0, len(texts), self.batch_size):
+            vectors.extend(self._encode(list(texts[i:i + self.batch_size])).tolist())
+        return vectors
+
+    def embed_query(self, text):
+        return self._encode([text])[0].tolist()
+
+
+def cosine_drift(reference, candidate):
+    """Summary of the cosine similarity between two sets of embeddings of the same texts"""
+    reference = np.asarray(reference, dtype=np.float32)
+    candidate = np.asarray(candidate, dtype=np.float32)
+    cosine = (reference * candidate).sum(axis=1) / (
+        np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1))
+    return {
+        "texts": len(cosine),
+        "mean_cosine": float(cosine.mean()),
+        "min_cosine": float(cosine.min()),
+        "p01_cosine": float(np.percentile(cosine, 1)),
+        "max_drift": float(1 - cosine.min()),
+    }
+
+
+def parity_check(persist_directory, sample_size=500):
+    """Compare PyTorch and ONNX embeddings of chunks stored in the vector store"""
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from store_versions import live_directory
+    import config
+
+    texts = Chroma(persist_directory=live_directory(persist_directory)).get(
+        limit=sample_size, include=["documents"])["documents"]
+    reference = HuggingFaceEmbeddings(model_name=config.EMBEDDING_MODEL,
+                                      model_kwargs={'device': 'cpu'}).embed_documents(texts)
+    report = {}
+    for quantize in (False, True):
+        candidate = OnnxEmbeddings(config.EMBEDDING_MODEL, config.ONNX_EXPORT_DIR,
+                                   quantize=quantize).embed_documents(texts)
+        report["onnx-int8" if quantize else "onnx"] = cosine_drift(reference, candidate)
+    return report
+
+
+if __name__ == "__main__":
+    # python onnx_embeddings.py [persist_directory]
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.join("chroma_db", "downloaded_pdfs")
+    for backend, stats in parity_check(directory).items():
+        print(backend, " ".join(f"{key}={value:.6f}" if isinstance(value, float) else f"{key}={value}"
+                                for key, value in stats.items()))
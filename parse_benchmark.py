@@ -0,0 +1,63 @@
+"""HTML parsing micro-benchmark of the scraper: per-page parse time before and after
+
+    python parse_benchmark.py fixtures/main_page.html saved_pages/*.html
+
+"before" is the full html.parser tree the scraper used to build, once per
+extraction (twice for a detail page: title, then PDF link); "after" is the
+single parse restricted to <a> and <h1> with the parser get_pdfs picked.
+Both paths are checked to extract the same links.
+"""
+import time
+import argparse
+import numpy as np
+from bs4 import BeautifulSoup
+import get_pdfs
+
+
+def before(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    links = [link['href'] for link in soup.find_all('a', href=True)]
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('h1')
+    return links, title.text.strip() if title else None
+
+
+def after(html):
+    soup = get_pdfs.parse_html(html, get_pdfs._LINKS_AND_TITLE)
+    links = [link['href'] for link in soup.find_all('a', href=True)]
+    title = soup.find('h1')
+    return links, title.text.strip() if title else None
+
+
+def time_parse(parse, html, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", default=["fixtures/main_page.html"])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"parser: {get_pdfs.HTML_PARSER}")
+    totals = [0.0, 0.0]
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        if before(html) != after(html):
+            print(f"{path}: extracted links differ between the two paths")
+        before_ms, after_ms = time_parse(before, html, args.repeat), time_parse(after, html, args.repeat)
+        totals[0] += before_ms
+        totals[1] += after_ms
+        print(f"{path} ({len(html) // 1024} KB): {before_ms:.1f} ms -> {after_ms:.1f} ms ({before_ms / after_ms:.1f}x)")
+    if len(args.pages) > 1:
+        print(f"mean per page: {totals[0] / len(args.pages):.1f} ms -> {totals[1] / len(args.pages):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import os
+import json
+import shutil
+import hashlib
+import threading
+from manifest import file_hash
+
+
+def changes_path(download_dir):
+    """The scraper's pending change list lives next to the download directory"""
+    return os.path.normpath(download_dir) + ".changes.json"
+
+
+def _pending_names(download_dir):
+    path = changes_path(download_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+def read_pending_changes(download_dir):
+    """PDF paths the scraper added or changed since the last ingestion, or None without a change list"""
+    names = _pending_names(download_dir)
+    return None if names is None else [os.path.join(download_dir, name) for name in names]
+
+
+def add_pending_changes(download_dir, paths):
+    """Merge paths into the pending change list, written atomically
+
+    File names are stored relative to the download directory, which the
+    scraper and init_db may name differently.
+    """
+    pending = _pending_names(download_dir) or []
+    pending = list(dict.fromkeys(pending + [os.path.relpath(path, download_dir) for path in paths]))
+    path = changes_path(download_dir)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"files": pending}, f, ensure_ascii=False, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+def check_pdf(path, expected_size=None):
+    """Why a downloaded file is not a complete PDF, or None if it looks like one"""
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        return f"{size} bytes instead of {expected_size}"
+    with open(path, "rb") as f:
+        if f.read(5) != b"%PDF-":
+            return "no %PDF header"
+        # The trailer may be followed by a little whitespace or garbage
+        f.seek(max(0, size - 1024))
+        if b"%%EOF" not in f.read():
+            return "no %%EOF trailer, truncated"
+    return None
+
+
+def clear_pending_changes(download_dir):
+    """Called once ingestion has consumed the change list"""
+    try:
+        os.remove(changes_path(download_dir))
+    except FileNotFoundError:
+        pass
+
+
+class PdfCache:
+    """Content-addressed store of downloaded PDFs, with the HTTP validators of each URL
+
+    objects/<hash[:2]>/<hash>.pdf  each distinct PDF content once, named by SHA-256
+    index.json                     {"urls": {url: {etag, last_modified, hash}}, "titles": {title: hash}}
+                                   titles: the content last placed in the download directory
+    partial/<key>.part             an unfinished download, resumed from where it stopped
+    partial/<key>.json             the validators of the version being downloaded, for If-Range
+
+    Files in the download directory are hard links to the objects, so an
+    unchanged PDF keeps its inode and mtime across crawls.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.urls = {}
+        self.titles = {}
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(cache_dir, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, "partial"), exist_ok=True)
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            self.urls = index.get("urls", {})
+            self.titles = index.get("titles", {})
+
+    def object_path(self, content_hash):
+        return os.path.join(self.cache_dir, "objects", content_hash[:2], f"{content_hash}.pdf")
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since for a URL whose content is still cached"""
+        entry = self.urls.get(url)
+        if not entry or not os.path.exists(self.object_path(entry["hash"])):
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def partial_path(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, "partial", f"{key}.part")
+
+    def _validators_path(self, url):
+        return self.partial_path(url)[:-len(".part")] + ".json"
+
+    def partial_state(self, url):
+        """(bytes already downloaded, {etag, last_modified}) of an unfinished download of url"""
+        path = self.partial_path(url)
+        if not (os.path.exists(path) and os.path.exists(self._validators_path(url))):
+            return 0, {}
+        with open(self._validators_path(url), encoding="utf-8") as f:
+            return os.path.getsize(path), json.load(f)
+
+    def start_partial(self, url, etag=None, last_modified=None):
+        """Begin a download of url from scratch; returns the partial file to write"""
+        path = self.partial_path(url)
+        with open(self._validators_path(url), "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "last_modified": last_modified}, f)
+        open(path, "wb").close()
+        return path
+
+    def discard_partial(self, url):
+        for name in (self.partial_path(url), self._validators_path(url)):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def add_file(self, url, path, etag=None, last_modified=None):
+        """Move a complete download into the object store; returns the content hash"""
+        content_hash = file_hash(path)
+        object_path = self.object_path(content_hash)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        if os.path.exists(object_path):
+            os.remove(path)
+        else:
+            os.replace(path, object_path)
+        self.record(url, content_hash, etag, last_modified)
+        return content_hash
+
+    def finish_partial(self, url):
+        """Move the finished partial download of url into the object store; returns the content hash"""
+        _, validators = self.partial_state(url)
+        content_hash = self.add_file(url, self.partial_path(url),
+                                     validators.get("etag"), validators.get("last_modified"))
+        self.discard_partial(url)
+        return content_hash
+
+    def record(self, url, content_hash, etag=None, last_modified=None):
+        with self.lock:
+            self.urls[url] = {"etag": etag, "last_modified": last_modified, "hash": content_hash}
+
+    def link(self, title, content_hash, filepath):
+        """Point filepath, the download of title, at a cached object; False if it already did
+
+        The titles index says what the file holds, so a copy (no hard links)
+        is not hashed again on every crawl.
+        """
+        object_path = self.object_path(content_hash)
+        if os.path.exists(filepath) and (self.titles.get(title) == content_hash
+                                         or os.path.samefile(filepath, object_path)):
+            with self.lock:
+                self.titles[title] = content_hash
+            return False
+        tmp_path = filepath + ".part"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(object_path, tmp_path)
+        except OSError:
+            # No hard links across file systems
+            shutil.copy2(object_path, tmp_path)
+        os.replace(tmp_path, filepath)
+        with self.lock:
+            self.titles[title] = content_hash
+        return True
+
+    def save(self):
+        """Write the index atomically"""
+        with self.lock:
+            data = {"urls": self.urls, "titles": self.titles}
+            with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(self.index_path + ".tmp", self.index_path)
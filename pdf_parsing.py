@@ -0,0 +1,40 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from langchain_community.document_loaders import PyPDFLoader
+
+
+def list_pdfs(pdf_path):
+    """All PDF files under pdf_path, in a stable order"""
+    pdf_files = []
+    for root, _, files in os.walk(pdf_path):
+        pdf_files.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+    return sorted(pdf_files)
+
+
+def parse_pdf(pdf_file):
+    """Extract the pages of one PDF; a failure is returned instead of raised"""
+    try:
+        return pdf_file, PyPDFLoader(pdf_file).load(), None
+    except Exception as e:
+        return pdf_file, [], f"{type(e).__name__}: {e}"
+
+
+def iter_parsed_pdfs(pdf_files, workers=None):
+    """Parse PDFs on a process pool, yielding (path, pages, error) in input order
+
+    At most two files per worker are in flight, so a slow consumer does not
+    make finished pages pile up in memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(parse_pdf, pdf_files)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for pdf_file in pdf_files:
+            pending.append(pool.submit(parse_pdf, pdf_file))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
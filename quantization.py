@@ -0,0 +1,85 @@
+import numpy as np
+
+# Centroids per subspace: each code is one byte
+PQ_CLUSTERS = 256
+
+
+def _kmeans(points, clusters, iterations, rng):
+    """Plain Lloyd's k-means; empty clusters are re-seeded from random points"""
+    centroids = points[rng.choice(len(points), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        distances = (points ** 2).sum(1)[:, None] - 2 * points @ centroids.T + (centroids ** 2).sum(1)[None, :]
+        assignment = distances.argmin(1)
+        counts = np.bincount(assignment, minlength=clusters)
+        sums = np.stack([np.bincount(assignment, weights=points[:, d], minlength=clusters)
+                         for d in range(points.shape[1])], axis=1)
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        if empty.any():
+            centroids[empty] = points[rng.choice(len(points), int(empty.sum()), replace=False)]
+    return centroids
+
+
+def train_pq(vectors, subspaces, clusters=PQ_CLUSTERS, iterations=20, sample=20000, seed=0):
+    """Codebooks of shape (subspaces, clusters, dim / subspaces) trained on a sample of vectors"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    count, dim = vectors.shape
+    if dim % subspaces:
+        raise ValueError(f"Vector dimension {dim} is not divisible by {subspaces} subspaces")
+    rng = np.random.default_rng(seed)
+    if count > sample:
+        vectors = vectors[rng.choice(count, sample, replace=False)]
+    clusters = min(clusters, len(vectors))
+    sub_dim = dim // subspaces
+    return np.stack([_kmeans(vectors[:, m * sub_dim:(m + 1) * sub_dim], clusters, iterations, rng)
+                     for m in range(subspaces)])
+
+
+def pq_encode(vectors, codebooks, block_size=16384):
+    """One uint8 code per subspace: the index of the nearest centroid"""
+    subspaces, _, sub_dim = codebooks.shape
+    codes = np.empty((len(vectors), subspaces), dtype=np.uint8)
+    norms = (codebooks ** 2).sum(2)
+    for start in range(0, len(vectors), block_size):
+        block = np.asarray(vectors[start:start + block_size], dtype=np.float32)
+        for m in range(subspaces):
+            part = block[:, m * sub_dim:(m + 1) * sub_dim]
+            codes[start:start + len(block), m] = (norms[m][None, :] - 2 * part @ codebooks[m].T).argmin(1)
+    return codes
+
+
+def pq_scores(query, codes, codebooks, block_size=16384):
+    """Asymmetric inner products: the raw query against the centroids of each stored code"""
+    subspaces, _, sub_dim = codebooks.shape
+    # Lookup table of the query's inner product with every centroid of every subspace
+    table = np.einsum("mkd,md->mk", codebooks, np.asarray(query, dtype=np.float32).reshape(subspaces, sub_dim))
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), block_size):
+        block = codes[start:start + block_size]
+        scores[start:start + len(block)] = table[np.arange(subspaces), block].sum(1)
+    return scores
+
+
+def int8_encode(vectors, block_size=16384):
+    """Symmetric per-vector int8 quantization; returns (codes, scales)"""
+    codes = np.empty(np.shape(vectors), dtype=np.int8)
+    scales = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), block_size):
+        block = np.asarray(vectors[start:start + block_size], dtype=np.float32)
+        scale = np.clip(np.abs(block).max(1), 1e-12, None) / 127
+        codes[start:start + len(block)] = np.rint(block / scale[:, None])
+        scales[start:start + len(block)] = scale
+    return codes, scales
+
+
+def int8_scores(query, codes, scales, block_size=4096):
+    """Inner products of the float query with int8 codes, rescaled per vector
+
+    Blocks are upcast to float32 for BLAS; small blocks stay in cache.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), block_size):
+        block = codes[start:start + block_size].astype(np.float32)
+        scores[start:start + len(block)] = (block @ query) * scales[start:start + len(block)]
+    return scores
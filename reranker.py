@@ -0,0 +1,98 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Any
+from langchain_core.retrievers import BaseRetriever
+from lexical_index import _chunk_id
+
+# Reranking runs here so the caller can stop waiting when the budget is spent
+_rerank_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rerank")
+
+
+class ScoreCache:
+    """LRU of cross-encoder scores keyed by (question hash, chunk id)"""
+
+    def __init__(self, max_size=50000):
+        self.max_size = max_size
+        self.scores = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            score = self.scores.get(key)
+            if score is not None:
+                self.scores.move_to_end(key)
+            return score
+
+    def put(self, key, score):
+        with self.lock:
+            self.scores[key] = score
+            self.scores.move_to_end(key)
+            while len(self.scores) > self.max_size:
+                self.scores.popitem(last=False)
+
+
+class RerankingRetriever(BaseRetriever):
+    """Over-fetch from a base retriever and keep the k best by cross-encoder score
+
+    Scoring runs in batches on a worker thread, which stops between
+    batches once time_budget seconds have passed, so an abandoned query
+    holds the pool for one batch at most. Candidates scored by then are
+    reordered among themselves; the others keep the base retriever's order.
+    Scores are cached for the next query.
+    """
+
+    base_retriever: BaseRetriever
+    cross_encoder: Any
+    score_cache: Any
+    k: int = 3
+    batch_size: int = 8
+    time_budget: float = 0.5
+    query_prefix: str = ""
+
+    def _score(self, question, question_hash, candidates, deadline, scores):
+        """Fill scores {chunk id: score}, from the cache then batch by batch until the deadline"""
+        pending = []
+        for document in candidates:
+            key = (question_hash, _chunk_id(document))
+            score = self.score_cache.get(key)
+            if score is None:
+                pending.append((key, document))
+            else:
+                scores[key[1]] = score
+        # In the base retriever's order, so the budget goes to its best candidates
+        for i in range(0, len(pending), self.batch_size):
+            if time.perf_counter() >= deadline:
+                return
+            batch = pending[i:i + self.batch_size]
+            batch_scores = self.cross_encoder.predict(
+                [(question, document.page_content) for _, document in batch],
+                batch_size=self.batch_size, show_progress_bar=False)
+            for (key, _), score in zip(batch, batch_scores):
+                self.score_cache.put(key, float(score))
+                scores[key[1]] = float(score)
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        candidates = self.base_retriever.invoke(query, config={"callbacks": run_manager.get_child()})
+        if len(candidates) <= 1:
+            return candidates
+        question = query[len(self.query_prefix):] if self.query_prefix and query.startswith(self.query_prefix) else query
+        question_hash = hashlib.sha256(question.encode("utf-8")).hexdigest()
+        deadline = time.perf_counter() + self.time_budget
+        scores = {}
+        future = _rerank_pool.submit(self._score, question, question_hash, candidates, deadline, scores)
+        try:
+            future.result(timeout=max(0.0, deadline - time.perf_counter()))
+        except TimeoutError:
+            pass
+        return rank_scored(candidates, dict(scores))[:self.k]
+
+
+def rank_scored(candidates, scores):
+    """Sort the scored candidates by score within the positions they hold; unscored ones stay in place"""
+    scored = sorted((document for document in candidates if _chunk_id(document) in scores),
+                    key=lambda document: scores[_chunk_id(document)], reverse=True)
+    ranked = iter(scored)
+    return [next(ranked) if _chunk_id(document) in scores else document for document in candidates]
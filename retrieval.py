@@ -0,0 +1,31 @@
+import config
+from lexical_index import HybridRetriever, lexical_index_path
+from reranker import RerankingRetriever
+
+ARABIC_PROMPT_PREFIX = "يرجى الإجابة على السؤال التالي باللغة العربية: "
+
+
+def build_retriever(vectorstore, persist_directory, reranker=None, k=None):
+    """The retriever the settings select; reranker is a (cross-encoder, ScoreCache) pair when RERANK is on
+
+    Shared by the app and the benchmark, so that benchmark figures are
+    those of the retriever that ships.
+    """
+    k = k or config.RETRIEVAL_K
+    # With reranking, the first stage over-fetches candidates
+    fetch_k = config.RERANK_FETCH_K if config.RERANK else k
+    if config.RETRIEVER == "hybrid":
+        # The BM25 index is only read on the first query
+        retriever = HybridRetriever(vectorstore=vectorstore, index_path=lexical_index_path(persist_directory),
+                                    k=fetch_k, fetch_k=max(fetch_k, config.HYBRID_FETCH_K),
+                                    query_prefix=ARABIC_PROMPT_PREFIX)
+    else:
+        retriever = vectorstore.as_retriever(search_kwargs={"k": fetch_k})
+    if config.RERANK:
+        cross_encoder, score_cache = reranker
+        retriever = RerankingRetriever(base_retriever=retriever, cross_encoder=cross_encoder,
+                                       score_cache=score_cache, k=k,
+                                       batch_size=config.RERANK_BATCH_SIZE,
+                                       time_budget=config.RERANK_TIME_BUDGET,
+                                       query_prefix=ARABIC_PROMPT_PREFIX)
+    return retriever
@@ -0,0 +1,89 @@
+import os
+import re
+import shutil
+from chromadb.api.shared_system_client import SharedSystemClient
+from manifest import manifest_path
+from dedup import dedup_index_path
+from lexical_index import lexical_index_path
+from flat_index import flat_index_path
+
+# Files that live next to a store directory and belong to it
+SIDECARS = (manifest_path, dedup_index_path, lexical_index_path, flat_index_path)
+
+
+def pointer_path(persist_directory):
+    """Names the live version of the store; replaced in one step by publish"""
+    return os.path.normpath(persist_directory) + ".current"
+
+
+def staging_path(persist_directory):
+    """Updates are built in a copy of the store, next to it"""
+    return os.path.normpath(persist_directory) + ".staging"
+
+
+def live_directory(persist_directory):
+    """Directory of the live version of the store, or None if there is none yet
+
+    Stores built before versioning are the persist directory itself.
+    """
+    pointer = pointer_path(persist_directory)
+    if os.path.exists(pointer):
+        with open(pointer, encoding="utf-8") as f:
+            name = f.read().strip()
+        return os.path.join(os.path.dirname(os.path.normpath(persist_directory)), name)
+    return os.path.normpath(persist_directory) if os.path.isdir(persist_directory) else None
+
+
+def _versions(persist_directory):
+    """Version directories of the store, oldest first, the legacy unversioned one included"""
+    base = os.path.normpath(persist_directory)
+    parent = os.path.dirname(base) or "."
+    pattern = re.compile(re.escape(os.path.basename(base)) + r"\.v(\d+)$")
+    found = sorted((int(match.group(1)), os.path.join(os.path.dirname(base), name))
+                   for name in os.listdir(parent) if (match := pattern.match(name)))
+    legacy = [base] if os.path.isdir(base) else []
+    return legacy + [path for _, path in found]
+
+
+def move_store(source, destination):
+    """Rename a store directory together with its sidecars"""
+    for sidecar in SIDECARS:
+        if os.path.exists(sidecar(source)):
+            os.replace(sidecar(source), sidecar(destination))
+    os.rename(source, destination)
+
+
+def remove_store(directory):
+    for sidecar in SIDECARS:
+        if os.path.isdir(sidecar(directory)):
+            shutil.rmtree(sidecar(directory), ignore_errors=True)
+        elif os.path.exists(sidecar(directory)):
+            os.remove(sidecar(directory))
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def publish(staging_directory, persist_directory):
+    """Make the finished staging copy the live version; returns its directory
+
+    The staging copy becomes a new version directory, then the pointer is
+    replaced atomically: a reader sees either the old version or the new
+    one. The version it replaces is kept, since running app processes may
+    still have it open until they notice the pointer changed; older ones
+    are removed.
+    """
+    # Clients cached by path would keep pointing at the renamed files
+    SharedSystemClient.clear_system_cache()
+    previous = live_directory(persist_directory)
+    versions = _versions(persist_directory)
+    number = 1 + max([int(path.rsplit(".v", 1)[1]) for path in versions if path != os.path.normpath(persist_directory)],
+                     default=0)
+    directory = f"{os.path.normpath(persist_directory)}.v{number}"
+    move_store(staging_directory, directory)
+    pointer = pointer_path(persist_directory)
+    with open(pointer + ".tmp", "w", encoding="utf-8") as f:
+        f.write(os.path.basename(directory))
+    os.replace(pointer + ".tmp", pointer)
+    for version in versions:
+        if version not in (previous, directory):
+            remove_store(version)
+    return directory
@@ -0,0 +1,63 @@
+import queue
+import threading
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class TokenStream(BaseCallbackHandler):
+    """Callback handler queueing retrieved sources and answer tokens as they are produced
+
+    Tokens of LLM calls made before retrieval (question condensation) are
+    not part of the answer and are dropped.
+    """
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.retrieved = False
+        self.retrievers = 0
+
+    def on_retriever_start(self, serialized, query, **kwargs):
+        self.retrievers += 1
+
+    def on_retriever_end(self, documents, **kwargs):
+        # Only the outermost retriever returns the documents the LLM will see
+        self.retrievers -= 1
+        if self.retrievers == 0:
+            self.retrieved = True
+            self.events.put(("sources", documents))
+
+    def on_retriever_error(self, error, **kwargs):
+        self.retrievers -= 1
+
+    def on_llm_new_token(self, token, **kwargs):
+        if self.retrieved and token:
+            self.events.put(("token", token))
+
+
+def stream_chain(chain, inputs, callbacks=()):
+    """Run chain.invoke in a worker thread and yield its events as they happen
+
+    Yields ("sources", documents) once retrieval is done, ("token", text)
+    for every answer token and finally ("result", response).
+    """
+    handler = TokenStream()
+    outcome = {}
+
+    def run():
+        try:
+            outcome["response"] = chain.invoke(inputs, config={"callbacks": [handler, *callbacks]})
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            handler.events.put(None)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    while True:
+        event = handler.events.get()
+        if event is None:
+            break
+        yield event
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    yield "result", outcome["response"]
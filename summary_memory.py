@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from pydantic import PrivateAttr
+from langchain.memory import ConversationBufferMemory
+from langchain.memory.prompt import SUMMARY_PROMPT
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import SystemMessage, get_buffer_string
+from chunking import estimate_tokens
+
+# Summaries are folded in the background, off the request path
+_summarizer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="memory-summary")
+
+
+class RollingSummaryMemory(ConversationBufferMemory):
+    """Chat memory with a token budget: recent turns verbatim, older ones summarized
+
+    After each turn, turns beyond max_turns, or beyond max_token_limit
+    tokens, are moved out of the buffer and folded into a rolling summary by
+    a background LLM call. Until that call finishes they are still returned
+    verbatim, so nothing is lost in between.
+
+    Tokens are counted locally by token_counter, a text length function
+    such as chunking.token_counter(); the rough estimate by default. The
+    LLM's own counter would fetch a GPT-2 tokenizer on the request path.
+    """
+
+    llm: BaseLanguageModel
+    max_turns: int = 3
+    max_token_limit: int = 1200
+    summary: str = ""
+    last_token_count: int = 0
+    token_counter: Any = estimate_tokens
+    _pending: list = PrivateAttr(default_factory=list)
+    _folding: bool = PrivateAttr(default=False)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def _message_tokens(self, messages):
+        return [self.token_counter(message.content) for message in messages]
+
+    def _count_tokens(self, messages):
+        return sum(self._message_tokens(messages))
+
+    def _context_messages(self):
+        with self._lock:
+            messages = [SystemMessage(content=self.summary)] if self.summary else []
+            return messages + list(self._pending) + list(self.chat_memory.messages)
+
+    @property
+    def buffer_as_messages(self):
+        return self._context_messages()
+
+    @property
+    def buffer_as_str(self):
+        return get_buffer_string(self._context_messages(), human_prefix=self.human_prefix,
+                                 ai_prefix=self.ai_prefix)
+
+    def load_memory_variables(self, inputs):
+        variables = super().load_memory_variables(inputs)
+        self.last_token_count = self._count_tokens(self._context_messages())
+        return variables
+
+    def save_context(self, inputs, outputs):
+        super().save_context(inputs, outputs)
+        messages = self.chat_memory.messages
+        # Counted once per turn; evicting a turn subtracts its count
+        counts = self._message_tokens(messages)
+        total = sum(counts)
+        evicted = []
+        # Keep at least the turn that was just saved
+        while len(messages) > 2 and (len(messages) > 2 * self.max_turns or total > self.max_token_limit):
+            evicted.extend(messages[:2])
+            total -= sum(counts[:2])
+            messages, counts = messages[2:], counts[2:]
+        if not evicted:
+            return
+        with self._lock:
+            self.chat_memory.messages = messages
+            self._pending.extend(evicted)
+            if self._folding:
+                return
+            self._folding = True
+        _summarizer.submit(self._fold)
+
+    def _fold(self):
+        with self._lock:
+            batch = list(self._pending)
+            summary = self.summary
+        try:
+            result = self.llm.invoke(SUMMARY_PROMPT.format(
+                summary=summary, new_lines=get_buffer_string(batch)))
+            new_summary = getattr(result, "content", result)
+        except Exception:
+            # Keep the turns pending; the next save_context retries
+            with self._lock:
+                self._folding = False
+            return
+        with self._lock:
+            self.summary = new_summary
+            del self._pending[:len(batch)]
+            again = bool(self._pending)
+            self._folding = again
+        if again:
+            _summarizer.submit(self._fold)
+
+    def clear(self):
+        super().clear()
+        with self._lock:
+            self.summary = ""
+            self._pending.clear()
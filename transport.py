@@ -0,0 +1,137 @@
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RequestStats:
+    """What one request cost: bytes received, seconds until its body was read, and retries"""
+
+    def __init__(self, url):
+        self.url = url
+        self.status = None
+        self.bytes = 0
+        self.duration = 0.0
+        self.retries = 0
+        self.error = None
+        self.started = time.monotonic()
+
+    def finish(self):
+        self.duration = time.monotonic() - self.started
+
+
+def retry_after(response, now=None):
+    """Seconds to wait according to a Retry-After header (delay or HTTP date), or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+class Transport:
+    """HTTP session of the scraper: sized connection pool, timeouts, retries and request metrics
+
+    Failed connections, timeouts and 429/5xx answers are retried up to
+    max_retries times, waiting as long as Retry-After asks, or else a
+    random delay of up to backoff * 2**attempt seconds ("full jitter"),
+    so that concurrent workers do not retry in lockstep. Calls block, the
+    concurrent crawler runs them in threads.
+    """
+
+    def __init__(self, pool_size=16, connect_timeout=10, read_timeout=60, max_retries=4,
+                 backoff=1.0, max_backoff=60, headers=None):
+        self.session = requests.Session()
+        # Retries are handled here, where they are counted and honour Retry-After
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = []
+        self.lock = threading.Lock()
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before retry number attempt + 1"""
+        if response is not None:
+            wait = retry_after(response)
+            if wait is not None:
+                return min(wait, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def get(self, url, stream=False, **kwargs):
+        """GET with retries; the stats of the request are attached to the response as .stats
+
+        The body of a streamed response is read with iter_content, which
+        adds its bytes and download time to the stats.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        stats = RequestStats(url)
+        with self.lock:
+            self.stats.append(stats)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(url, stream=stream, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    stats.error = type(e).__name__
+                    stats.finish()
+                    raise
+                wait = self.delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    break
+                wait = self.delay(attempt, response)
+                response.close()
+            attempt += 1
+            stats.retries = attempt
+            time.sleep(wait)
+        stats.status = response.status_code
+        response.stats = stats
+        if not stream:
+            stats.bytes = len(response.content)
+        stats.finish()
+        return response
+
+    def iter_content(self, response, chunk_size=8192):
+        """Yield the body of a streamed response, counting its bytes into the request's stats"""
+        stats = response.stats
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                stats.bytes += len(chunk)
+                yield chunk
+        finally:
+            stats.finish()
+            response.close()
+
+    def summary(self):
+        """Totals of the requests made so far, with p50/p95 durations in milliseconds"""
+        with self.lock:
+            stats = list(self.stats)
+        durations = sorted(s.duration for s in stats)
+        statuses = {}
+        for s in stats:
+            key = str(s.status or s.error)
+            statuses[key] = statuses.get(key, 0) + 1
+        percentile = lambda q: round(durations[min(len(durations) - 1, int(q / 100 * len(durations)))] * 1000, 1)
+        return {
+            "requests": len(stats),
+            "retries": sum(s.retries for s in stats),
+            "bytes": sum(s.bytes for s in stats),
+            "statuses": statuses,
+            **({"p50_ms": percentile(50), "p95_ms": percentile(95)} if durations else {}),
+        }